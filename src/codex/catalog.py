@@ -9,20 +9,37 @@ and are used as defaults. Local fragments in .codex/fragments/ take precedence.
 """
 
 import hashlib
+import os
 import re
-from dataclasses import dataclass
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from importlib.resources import files
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 
 from codex.manifest import FRAGMENTS_DIR, load_manifest
+from codex.yamlio import SafeLoader
 
-FRAGMENT_PATTERN = re.compile(r"^([a-z0-9-]+)@(\d+\.\d+\.\d+)\.yaml$")
+FRAGMENT_PATTERN = re.compile(r"([a-z0-9-]+)@(\d+\.\d+\.\d+)\.yaml")
 
+# Directories with at least this many fragments are read from a thread pool
+PARALLEL_READ_MIN = 8
 
-@dataclass
+# ...and parsed across worker processes. Process startup costs far more
+# than parsing a handful of fragments, so only large catalogs qualify.
+PARALLEL_PARSE_MIN = 64
+
+# Last discovered catalog, keyed by the local fragments directory and the
+# stat signature of its YAML files. Bundled fragments cannot change while
+# the process runs, so only local edits need to invalidate it.
+_CATALOG_CACHE: tuple[tuple[Any, ...], dict[str, list["Fragment"]]] | None = None
+
+
+@dataclass(slots=True, frozen=True)
 class Fragment:
     """Represents a governance fragment."""
 
@@ -32,38 +49,50 @@ class Fragment:
     path: Path
     content: dict[str, Any]
     sha256: str
+    source: Literal["bundled", "local"] = "local"
+    version_tuple: tuple[int, ...] = field(init=False, repr=False)
+    full_name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def full_name(self) -> str:
-        """Return name@version format."""
-        return f"{self.name}@{self.version}"
+    def __post_init__(self) -> None:
+        # Numeric key so 1.10.0 sorts after 1.2.0
+        version_tuple = tuple(int(part) for part in self.version.split("."))
+        object.__setattr__(self, "version_tuple", version_tuple)
+        # name@version, built once; interned as names are few and compared often
+        object.__setattr__(self, "full_name", sys.intern(f"{self.name}@{self.version}"))
 
 
 def compute_sha256(path: Path) -> str:
     """Compute SHA256 hash of a file."""
     with open(path, "rb") as f:
-        return hashlib.sha256(f.read()).hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def parse_fragment_filename(filename: str) -> tuple[str, str] | None:
     """Parse fragment filename into (name, version) or None if invalid."""
-    match = FRAGMENT_PATTERN.match(filename)
+    match = FRAGMENT_PATTERN.fullmatch(filename)
     if match:
         return match.group(1), match.group(2)
     return None
 
 
-def load_fragment(path: Path) -> Fragment:
-    """Load a fragment from disk."""
-    parsed = parse_fragment_filename(path.name)
+def _fragment_from_bytes(
+    path: Path,
+    data: bytes,
+    source: Literal["bundled", "local"] = "local",
+    parsed: tuple[str, str] | None = None,
+) -> Fragment:
+    """Build a Fragment from raw file bytes, hashing and parsing one buffer.
+
+    ``parsed`` is the (name, version) pair when the caller has already
+    matched the filename.
+    """
+    if parsed is None:
+        parsed = parse_fragment_filename(path.name)
     if not parsed:
         raise ValueError(f"Invalid fragment filename: {path.name}")
 
     name, version = parsed
-    sha256 = compute_sha256(path)
-
-    with open(path) as f:
-        content = yaml.safe_load(f)
+    content = yaml.load(data, Loader=SafeLoader)
 
     if not content:
         raise ValueError(f"Empty fragment: {path}")
@@ -81,10 +110,16 @@ def load_fragment(path: Path) -> Fragment:
         domain=domain,
         path=path,
         content=content,
-        sha256=sha256,
+        sha256=hashlib.sha256(data).hexdigest(),
+        source=source,
     )
 
 
+def load_fragment(path: Path) -> Fragment:
+    """Load a fragment from disk."""
+    return _fragment_from_bytes(path, path.read_bytes())
+
+
 def get_fragments_dir() -> Path:
     """Get the local fragments directory path."""
     return Path.cwd() / FRAGMENTS_DIR
@@ -95,67 +130,117 @@ def get_bundled_fragments_dir():
     return files("codex.data") / "fragments"
 
 
+def _read_fragment_files(items: list[Any]) -> list[tuple[Any, bytes]]:
+    """Read fragment files, overlapping the reads for larger catalogs."""
+    if len(items) < PARALLEL_READ_MIN:
+        return [(item, item.read_bytes()) for item in items]
+
+    with ThreadPoolExecutor() as executor:
+        return list(zip(items, executor.map(lambda item: item.read_bytes(), items)))
+
+
+def _parse_fragment_worker(
+    path: Path,
+    data: bytes,
+    source: Literal["bundled", "local"],
+    parsed: tuple[str, str],
+) -> Fragment | str:
+    """
+    Parse one fragment, returning the error message if it is invalid.
+
+    Defined at module level so it can be dispatched to worker processes.
+    """
+    try:
+        return _fragment_from_bytes(path, data, source, parsed)
+    except (ValueError, yaml.YAMLError) as e:
+        return str(e)
+
+
 def _load_fragments_from_dir(
-    directory, catalog: dict[str, list[Fragment]], verbose: bool = False
+    directory,
+    catalog: dict[str, list[Fragment]],
+    source: Literal["bundled", "local"],
+    verbose: bool = False,
 ) -> None:
-    """Load fragments from a directory into the catalog."""
+    """Load fragments from a directory into the catalog.
+
+    Accepts a Path or a Traversable from importlib.resources; both are
+    read as bytes so bundled and local fragments hash identically.
+    """
     try:
-        # Handle both Path and Traversable (from importlib.resources)
-        if hasattr(directory, "iterdir"):
-            items = list(directory.iterdir())
+        if isinstance(directory, Path):
+            # scandir reports file types from the directory listing itself
+            with os.scandir(directory) as entries:
+                candidates = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file()
+                ]
         else:
-            items = list(directory.glob("*.yaml"))
-
-        for item in items:
-            if not str(item).endswith(".yaml"):
+            candidates = [item for item in directory.iterdir() if item.name.endswith(".yaml")]
+
+        items = []
+        names = []
+        for item in candidates:
+            # Reject bad names before reading or parsing anything
+            parsed = parse_fragment_filename(item.name)
+            if parsed is None:
+                if verbose:
+                    print(f"Skipping invalid fragment: Invalid fragment filename: {item.name}")
                 continue
+            items.append(item)
+            names.append(parsed)
+
+        files = _read_fragment_files(items)
+        paths = [Path(str(item)) for item, _ in files]
+        sources = [data for _, data in files]
+        args = (paths, sources, repeat(source), names)
+
+        # libyaml parsing is CPU-bound, so large catalogs use all cores
+        results: list[Fragment | str]
+        if len(files) >= PARALLEL_PARSE_MIN:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_parse_fragment_worker, *args))
+        else:
+            results = list(map(_parse_fragment_worker, *args))
 
-            try:
-                # For bundled resources, we need to extract to a temp file
-                if hasattr(item, "read_text"):
-                    # This is a Traversable from importlib.resources
-                    content_text = item.read_text()
-                    parsed = parse_fragment_filename(item.name)
-                    if not parsed:
-                        continue
-
-                    name, version = parsed
-                    content = yaml.safe_load(content_text)
-
-                    if not content or content.get("kind") != "GovernanceFragment":
-                        continue
-
-                    metadata = content.get("metadata", {})
-                    domain = metadata.get("domain", "unknown")
-
-                    # Compute hash from content
-                    sha256 = hashlib.sha256(content_text.encode()).hexdigest()
-
-                    fragment = Fragment(
-                        name=name,
-                        version=version,
-                        domain=domain,
-                        path=Path(str(item)),  # Store as Path for consistency
-                        content=content,
-                        sha256=sha256,
-                    )
-                else:
-                    # Regular Path object
-                    fragment = load_fragment(item)
-
-                catalog.setdefault(fragment.name, []).append(fragment)
+        for result in results:
+            if isinstance(result, str):
                 if verbose:
-                    print(f"Discovered: {fragment.full_name} ({fragment.domain})")
+                    print(f"Skipping invalid fragment: {result}")
+                continue
 
-            except (ValueError, yaml.YAMLError) as e:
-                if verbose:
-                    print(f"Skipping invalid fragment: {e}")
+            catalog.setdefault(result.name, []).append(result)
+            if verbose:
+                print(f"Discovered: {result.full_name} ({result.domain})")
 
     except (FileNotFoundError, TypeError):
         # Directory doesn't exist or isn't traversable
         pass
 
 
+def _local_dir_signature(local_dir: Path) -> tuple[tuple[str, int, int], ...] | None:
+    """Return (name, mtime_ns, size) for each YAML file, or None if missing."""
+    try:
+        with os.scandir(local_dir) as entries:
+            return tuple(
+                sorted(
+                    (entry.name, st.st_mtime_ns, st.st_size)
+                    for entry in entries
+                    if entry.name.endswith(".yaml")
+                    for st in (entry.stat(),)
+                )
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def invalidate_catalog_cache() -> None:
+    """Drop the cached catalog so the next discovery rescans the disk."""
+    global _CATALOG_CACHE
+    _CATALOG_CACHE = None
+
+
 def discover_fragments(verbose: bool = False) -> dict[str, list[Fragment]]:
     """
     Discover all fragments from bundled package and local catalog.
@@ -163,32 +248,82 @@ def discover_fragments(verbose: bool = False) -> dict[str, list[Fragment]]:
     Bundled fragments (from package) are loaded first, then local fragments
     in .codex/fragments/ are overlaid. Local fragments with the same name
     and version will override bundled ones.
+
+    The result is cached until a local fragment file is added, removed or
+    modified, so callers must treat it as read-only.
     """
+    global _CATALOG_CACHE
+
+    local_dir = get_fragments_dir()
+    cache_key = (str(local_dir), _local_dir_signature(local_dir))
+    if _CATALOG_CACHE is not None and _CATALOG_CACHE[0] == cache_key:
+        if verbose:
+            print("Using cached fragment catalog")
+        return _CATALOG_CACHE[1]
+
     catalog: dict[str, list[Fragment]] = {}
 
     # 1. Load bundled fragments from package
     bundled_dir = get_bundled_fragments_dir()
-    _load_fragments_from_dir(bundled_dir, catalog, verbose=verbose)
+    _load_fragments_from_dir(bundled_dir, catalog, "bundled", verbose=verbose)
 
     # 2. Overlay local fragments (can override bundled)
-    local_dir = get_fragments_dir()
-    if local_dir.exists():
-        _load_fragments_from_dir(local_dir, catalog, verbose=verbose)
+    if cache_key[1] is not None:
+        _load_fragments_from_dir(local_dir, catalog, "local", verbose=verbose)
 
     # Sort versions for each fragment (newest first)
-    for name in catalog:
+    for name, frags in catalog.items():
         # Deduplicate by version (local overrides bundled)
-        seen_versions: dict[str, Fragment] = {}
-        for frag in catalog[name]:
-            seen_versions[frag.version] = frag
-        catalog[name] = sorted(seen_versions.values(), key=lambda f: f.version, reverse=True)
-
+        by_version: dict[str, Fragment] = {}
+        for frag in frags:
+            existing = by_version.get(frag.version)
+            if existing is None or existing.source != "local":
+                by_version[frag.version] = frag
+        frags[:] = by_version.values()
+        frags.sort(key=lambda f: f.version_tuple, reverse=True)
+
+    _CATALOG_CACHE = (cache_key, catalog)
     return catalog
 
 
-def resolve_fragment(name: str, version: str | None = None, verbose: bool = False) -> Fragment:
-    """Resolve a fragment reference to a concrete Fragment."""
-    catalog = discover_fragments(verbose=verbose)
+def _load_exact_fragment(name: str, version: str) -> Fragment | None:
+    """Load name@version from the local, then bundled, catalog without a scan.
+
+    Returns None when neither copy is a valid fragment, leaving the caller
+    to fall back to full discovery.
+    """
+    filename = f"{name}@{version}.yaml"
+    parsed = parse_fragment_filename(filename)
+    if parsed is None:
+        return None
+
+    sources: tuple[tuple[Any, Literal["bundled", "local"]], ...] = (
+        (get_fragments_dir() / filename, "local"),
+        (get_bundled_fragments_dir() / filename, "bundled"),
+    )
+    for path, source in sources:
+        try:
+            return _fragment_from_bytes(Path(str(path)), path.read_bytes(), source, parsed)
+        except (OSError, ValueError, yaml.YAMLError):
+            continue
+    return None
+
+
+def resolve_fragment(
+    name: str,
+    version: str | None = None,
+    verbose: bool = False,
+    catalog: dict[str, list[Fragment]] | None = None,
+) -> Fragment:
+    """Resolve a fragment reference to a concrete Fragment.
+
+    Pass ``catalog`` to resolve several references against one discovery.
+    """
+    if catalog is None:
+        # An exact version names a single file, so load it directly
+        if version and (fragment := _load_exact_fragment(name, version)):
+            return fragment
+        catalog = discover_fragments(verbose=verbose)
 
     if name not in catalog:
         raise ValueError(f"Fragment not found: {name}")
@@ -206,20 +341,26 @@ def resolve_fragment(name: str, version: str | None = None, verbose: bool = Fals
 
 
 def list_catalog_fragments(
-    show_all: bool = False, installed_only: bool = False, verbose: bool = False
+    show_all: bool = False,
+    installed_only: bool = False,
+    verbose: bool = False,
+    catalog: dict[str, list[Fragment]] | None = None,
 ) -> list[str]:
     """List fragments in the catalog."""
-    catalog = discover_fragments(verbose=verbose)
+    if catalog is None:
+        catalog = discover_fragments(verbose=verbose)
 
     if installed_only:
         manifest = load_manifest(verbose=verbose)
-        installed = set(manifest.get("fragments", []))
-        return [
-            frag.full_name
-            for frags in catalog.values()
-            for frag in frags
-            if frag.name in installed or frag.full_name in installed
-        ]
+
+        # Walk the manifest, not the catalog; a bare name lists every version
+        listed: dict[str, None] = {}
+        for ref in manifest.get("fragments", []):
+            name, _, version = ref.partition("@")
+            for frag in catalog.get(name, ()):
+                if not version or frag.version == version:
+                    listed[frag.full_name] = None
+        return list(listed)
 
     if show_all:
         return [frag.full_name for frags in catalog.values() for frag in frags]
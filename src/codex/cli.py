@@ -11,12 +11,26 @@ Commands:
     codex diff              Show changes since last weave
 """
 
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
 
 from codex import __version__
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_CONSOLE: "Console | None" = None
+
+
+def _console() -> "Console":
+    """Return the shared rich console, importing rich on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+
+        _CONSOLE = Console()
+    return _CONSOLE
 
 
 @click.group()
@@ -41,6 +55,7 @@ def init(ctx: click.Context, skip_agents: bool) -> None:
     from codex.manifest import initialize_manifest
 
     verbose = ctx.obj.get("verbose", False)
+    console = _console()
     try:
         created = initialize_manifest(verbose=verbose, skip_agents=skip_agents)
         console.print("[green]✓[/green] Initialized CODEX structure")
@@ -59,6 +74,7 @@ def add(ctx: click.Context, fragments: tuple[str, ...]) -> None:
     from codex.manifest import add_fragments
 
     verbose = ctx.obj.get("verbose", False)
+    console = _console()
     try:
         added = add_fragments(list(fragments), verbose=verbose)
         for frag in added:
@@ -76,6 +92,7 @@ def remove(ctx: click.Context, fragment: str) -> None:
     from codex.manifest import remove_fragment
 
     verbose = ctx.obj.get("verbose", False)
+    console = _console()
     try:
         remove_fragment(fragment, verbose=verbose)
         console.print(f"[green]✓[/green] Removed {fragment}")
@@ -93,6 +110,7 @@ def list_fragments(ctx: click.Context, show_all: bool, installed: bool) -> None:
     from codex.catalog import list_catalog_fragments
 
     verbose = ctx.obj.get("verbose", False)
+    console = _console()
     try:
         fragments = list_catalog_fragments(
             show_all=show_all, installed_only=installed, verbose=verbose
@@ -118,6 +136,7 @@ def weave(ctx: click.Context, locked: bool, dry_run: bool, check: bool, skip_age
     from codex.render import weave_artifacts
 
     verbose = ctx.obj.get("verbose", False)
+    console = _console()
     try:
         result = weave_artifacts(
             locked=locked,
@@ -154,6 +173,7 @@ def validate(ctx: click.Context, ast: bool, stack: bool) -> None:
     from codex.validators import run_validators
 
     verbose = ctx.obj.get("verbose", False)
+    console = _console()
     try:
         result = run_validators(ast_only=ast, stack_only=stack, verbose=verbose)
         if result.passed:
@@ -175,6 +195,7 @@ def diff(ctx: click.Context) -> None:
     from codex.render import show_diff
 
     verbose = ctx.obj.get("verbose", False)
+    console = _console()
     try:
         changes = show_diff(verbose=verbose)
         if not changes:
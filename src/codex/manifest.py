@@ -5,12 +5,16 @@ The manifest is the user's declaration of which governance fragments
 should be applied in what order.
 """
 
+import copy
+import os
 from importlib import resources
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from codex.yamlio import SafeDumper, SafeLoader
+
 MANIFEST_FILE = "codex.manifest.yaml"
 CODEX_DIR = ".codex"
 FRAGMENTS_DIR = ".codex/fragments"
@@ -20,7 +24,7 @@ AGENTS_FILE = "AGENTS.md"
 COPILOT_INSTRUCTIONS_FILE = ".github/copilot-instructions.md"
 AGENTS_TEMPLATE_FILE = ".codex/standards/agents.md"
 
-DEFAULT_MANIFEST = {
+DEFAULT_MANIFEST: dict[str, Any] = {
     "version": "1.0",
     "fragments": [
         "base@1.0.0",
@@ -31,6 +35,9 @@ DEFAULT_MANIFEST = {
     ],
 }
 
+# Last loaded manifest per path, with the (mtime_ns, size) it was read at
+_MANIFEST_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 COPILOT_INSTRUCTIONS_TEMPLATE = """# GitHub Copilot Instructions
 
 This repository uses **CODEX Weaver** for governance-as-code.
@@ -49,6 +56,12 @@ refer to the `AGENTS.md` file at the repository root.
 """
 
 
+def _default_manifest() -> dict[str, Any]:
+    """Return a fresh default manifest that is safe to edit."""
+    # A shallow copy would share the fragments list with DEFAULT_MANIFEST
+    return {**DEFAULT_MANIFEST, "fragments": list(DEFAULT_MANIFEST["fragments"])}
+
+
 def get_manifest_path() -> Path:
     """Get the path to the manifest file."""
     return Path.cwd() / MANIFEST_FILE
@@ -57,23 +70,44 @@ def get_manifest_path() -> Path:
 def load_manifest(verbose: bool = False) -> dict[str, Any]:
     """Load and parse the manifest file."""
     manifest_path = get_manifest_path()
-    if not manifest_path.exists():
-        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
+    try:
+        st = os.stat(manifest_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}") from None
+
+    # Reuse the parsed manifest while the file is unchanged; callers get a
+    # copy because add/remove edit the fragments list in place
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _MANIFEST_CACHE.get(str(manifest_path))
+    if cached is not None and cached[0] == key:
+        return copy.deepcopy(cached[1])
 
     with open(manifest_path) as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=SafeLoader)
 
     if verbose:
         print(f"Loaded manifest from {manifest_path}")
 
-    return manifest or DEFAULT_MANIFEST.copy()
+    manifest = manifest or _default_manifest()
+    _MANIFEST_CACHE[str(manifest_path)] = (key, copy.deepcopy(manifest))
+    return manifest
 
 
 def save_manifest(manifest: dict[str, Any], verbose: bool = False) -> None:
     """Save the manifest to disk."""
     manifest_path = get_manifest_path()
-    with open(manifest_path, "w") as f:
-        yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
+    data = yaml.dump(manifest, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+
+    # Write a sibling temp file and rename it over the manifest, so readers
+    # never see a partially written file
+    tmp_path = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data.encode())
+        os.replace(tmp_path, manifest_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _MANIFEST_CACHE.pop(str(manifest_path), None)
 
     if verbose:
         print(f"Saved manifest to {manifest_path}")
@@ -106,7 +140,7 @@ def initialize_agent_instructions(verbose: bool = False, skip_agents: bool = Fal
 
     # Create copilot-instructions.md
     copilot_path = cwd / COPILOT_INSTRUCTIONS_FILE
-    if not copilot_path.exists():
+    if not os.path.exists(copilot_path):
         copilot_path.write_text(COPILOT_INSTRUCTIONS_TEMPLATE)
         created.append(str(copilot_path))
         if verbose:
@@ -118,8 +152,8 @@ def initialize_agent_instructions(verbose: bool = False, skip_agents: bool = Fal
     # Create AGENTS.md from template
     agents_path = cwd / AGENTS_FILE
     agents_template = cwd / AGENTS_TEMPLATE_FILE
-    if not agents_path.exists():
-        if agents_template.exists():
+    if not os.path.exists(agents_path):
+        if os.path.exists(agents_template):
             # Copy from template
             agents_path.write_text(agents_template.read_text())
         else:
@@ -226,8 +260,8 @@ def initialize_manifest(verbose: bool = False, skip_agents: bool = False) -> lis
 
     # Create manifest if it doesn't exist
     manifest_path = get_manifest_path()
-    if not manifest_path.exists():
-        save_manifest(DEFAULT_MANIFEST.copy(), verbose=verbose)
+    if not os.path.exists(manifest_path):
+        save_manifest(_default_manifest(), verbose=verbose)
         created.append(str(manifest_path))
         if verbose:
             print(f"Created {MANIFEST_FILE}")
@@ -235,11 +269,13 @@ def initialize_manifest(verbose: bool = False, skip_agents: bool = False) -> lis
         if verbose:
             print(f"{MANIFEST_FILE} already exists")
 
-    # Materialize bundled standards into .codex/standards if missing
-    created.extend(_materialize_standards(cwd, verbose=verbose))
+    # Materialize bundled standards and fragments into .codex if missing
+    created.extend(_materialize_bundled(cwd, verbose=verbose))
+
+    # Fragment files were just written; don't serve a catalog from before
+    from codex.catalog import invalidate_catalog_cache
 
-    # Materialize bundled fragments into .codex/fragments if missing
-    created.extend(_materialize_fragments(cwd, verbose=verbose))
+    invalidate_catalog_cache()
 
     # Create agent instruction files
     agent_files = initialize_agent_instructions(verbose=verbose, skip_agents=skip_agents)
@@ -251,81 +287,63 @@ def initialize_manifest(verbose: bool = False, skip_agents: bool = False) -> lis
     return created
 
 
-def _materialize_standards(cwd: Path, verbose: bool = False) -> list[str]:
-    """Ensure .codex/standards contains the bundled base templates.
-
-    Copies packaged standards into the local .codex/standards directory
-    if they do not already exist. Existing files are left untouched to
-    allow local customization.
-    """
-
-    created: list[str] = []
-    standards_dir = cwd / STANDARDS_DIR
-
-    # Expected standard templates shipped with the package
-    standard_files = ["architecture.md", "process.md", "security.md", "agents.md"]
-
-    for name in standard_files:
-        target_path = standards_dir / name
-        if target_path.exists():
-            if verbose:
-                print(f"Standard template {target_path} already exists")
-            continue
-
-        try:
-            with resources.files("codex.data.standards").joinpath(name).open("r", encoding="utf-8") as src:
-                content = src.read()
-        except FileNotFoundError:
-            if verbose:
-                print(f"Packaged standard template not found: {name}")
-            continue
-
-        target_path.write_text(content)
-        created.append(str(target_path))
-        if verbose:
-            print(f"Created standard template {target_path}")
-
-    return created
-
-
-def _materialize_fragments(cwd: Path, verbose: bool = False) -> list[str]:
-    """Ensure .codex/fragments contains the bundled core fragments.
-
-    Copies packaged fragment YAML files into the local .codex/fragments
-    directory if they do not already exist. Existing files are preserved
-    to allow local overrides.
+# Bundled files copied into a new project: (package, file names, target dir, label)
+BUNDLED_FILES = (
+    (
+        "codex.data.standards",
+        ("architecture.md", "process.md", "security.md", "agents.md"),
+        STANDARDS_DIR,
+        "standard template",
+    ),
+    (
+        "codex.data.fragments",
+        (
+            "base@1.0.0.yaml",
+            "architecture-core@1.0.0.yaml",
+            "stack-core@1.0.0.yaml",
+            "process-core@1.0.0.yaml",
+            "security-core@1.0.0.yaml",
+        ),
+        FRAGMENTS_DIR,
+        "fragment",
+    ),
+)
+
+
+def _materialize_bundled(cwd: Path, verbose: bool = False) -> list[str]:
+    """Ensure .codex/standards and .codex/fragments contain the bundled files.
+
+    Copies packaged standards and core fragments into the local .codex
+    directories if they do not already exist. Existing files are left
+    untouched to allow local customization.
     """
 
     created: list[str] = []
-    fragments_dir = cwd / FRAGMENTS_DIR
-
-    fragment_files = [
-        "base@1.0.0.yaml",
-        "architecture-core@1.0.0.yaml",
-        "stack-core@1.0.0.yaml",
-        "process-core@1.0.0.yaml",
-        "security-core@1.0.0.yaml",
-    ]
-
-    for name in fragment_files:
-        target_path = fragments_dir / name
-        if target_path.exists():
-            if verbose:
-                print(f"Fragment {target_path} already exists")
-            continue
 
+    for package, names, target_dir, label in BUNDLED_FILES:
+        # One directory listing answers every existence check for this group
         try:
-            with resources.files("codex.data.fragments").joinpath(name).open("r", encoding="utf-8") as src:
-                content = src.read()
+            existing = set(os.listdir(cwd / target_dir))
         except FileNotFoundError:
+            existing = set()
+        for name in names:
+            target_path = cwd / target_dir / name
+            if name in existing:
+                if verbose:
+                    print(f"{label.capitalize()} {target_path} already exists")
+                continue
+
+            try:
+                data = resources.files(package).joinpath(name).read_bytes()
+            except FileNotFoundError:
+                if verbose:
+                    print(f"Packaged {label} not found: {name}")
+                continue
+
+            target_path.write_bytes(data)
+            created.append(str(target_path))
             if verbose:
-                print(f"Packaged fragment not found: {name}")
-            continue
-
-        target_path.write_text(content)
-        created.append(str(target_path))
-        if verbose:
-            print(f"Created fragment {target_path}")
+                print(f"Created {label} {target_path}")
 
     return created
 
@@ -341,31 +359,16 @@ def add_fragments(fragments: list[str], verbose: bool = False) -> list[str]:
     manifest = load_manifest(verbose=verbose)
     existing_list = manifest.get("fragments", [])
 
-    # Build set of base names (without version) for duplicate detection
-    existing_base_names: set[str] = set()
-    for frag in existing_list:
-        if "@" in frag:
-            base_name = frag.rsplit("@", 1)[0]
-        else:
-            base_name = frag
-        existing_base_names.add(base_name)
+    # Base names (without version) for duplicate detection
+    existing_base_names = {frag.rsplit("@", 1)[0] for frag in existing_list}
 
-    catalog = discover_fragments(verbose=verbose)
+    catalog = None
     added = []
+    new_refs = []
 
     for frag in fragments:
         # Extract base name for comparison
-        if "@" in frag:
-            base_name = frag.rsplit("@", 1)[0]
-            normalized = frag
-        else:
-            base_name = frag
-            # Resolve to latest version
-            if base_name in catalog and catalog[base_name]:
-                version = catalog[base_name][0].version
-                normalized = f"{base_name}@{version}"
-            else:
-                normalized = frag
+        base_name = frag.rsplit("@", 1)[0]
 
         # Skip if already present (by base name)
         if base_name in existing_base_names:
@@ -373,13 +376,22 @@ def add_fragments(fragments: list[str], verbose: bool = False) -> list[str]:
                 print(f"Fragment already in manifest: {base_name}")
             continue
 
-        manifest.setdefault("fragments", []).append(normalized)
+        normalized = frag
+        if "@" not in frag:
+            # Resolve to latest version; only needs the catalog the first time
+            if catalog is None:
+                catalog = discover_fragments(verbose=verbose)
+            if catalog.get(base_name):
+                normalized = f"{base_name}@{catalog[base_name][0].version}"
+
+        new_refs.append(normalized)
         existing_base_names.add(base_name)
         added.append(base_name)
         if verbose:
             print(f"Adding fragment: {normalized}")
 
     if added:
+        manifest["fragments"] = [*existing_list, *new_refs]
         save_manifest(manifest, verbose=verbose)
 
     return added
@@ -7,6 +7,7 @@ Implements the fragment merging logic with:
 - Security veto system
 """
 
+from itertools import chain
 from typing import Any
 
 
@@ -28,15 +29,17 @@ def set_union_stable(base: list[Any], overlay: list[Any]) -> list[Any]:
     seen: set[Any] = set()
     result: list[Any] = []
 
-    for item in base + overlay:
-        # Handle unhashable items
-        try:
-            if item not in seen:
+    for item in chain(base, overlay):
+        # Unhashable items (dicts, lists) can't be deduplicated; keep them all.
+        # The type check skips the common case without raising.
+        if type(item).__hash__ is not None:
+            try:
+                if item in seen:
+                    continue
                 seen.add(item)
-                result.append(item)
-        except TypeError:
-            # Unhashable item, just append
-            result.append(item)
+            except TypeError:
+                pass  # Hashable type with unhashable contents, e.g. (1, [2])
+        result.append(item)
 
     return result
 
@@ -55,18 +58,19 @@ def merge_with_strategy(
     Returns:
         Merged dictionary
     """
-    if schema is None:
-        schema = {}
+    if not base:
+        return dict(overlay)
 
-    result = base.copy()
+    properties = schema.get("properties", {}) if schema else {}
 
-    for key, value in overlay.items():
-        if key not in result:
-            result[key] = value
-            continue
+    # Keys only in overlay are taken as-is; only shared keys need a strategy
+    result = base | {key: value for key, value in overlay.items() if key not in base}
 
-        existing = result[key]
-        strategy = get_merge_strategy(schema, key)
+    for key in overlay.keys() & base.keys():
+        value = overlay[key]
+        existing = base[key]
+        key_schema = properties.get(key, {})
+        strategy = key_schema.get("x-merge-strategy", "replace")
 
         if isinstance(value, list) and isinstance(existing, list):
             if strategy == "set-union-stable":
@@ -78,8 +82,7 @@ def merge_with_strategy(
 
         elif isinstance(value, dict) and isinstance(existing, dict):
             # Recursively merge dicts
-            nested_schema = schema.get("properties", {}).get(key, {})
-            result[key] = merge_with_strategy(existing, value, nested_schema)
+            result[key] = merge_with_strategy(existing, value, key_schema)
 
         else:
             # Scalar override - last wins
@@ -103,16 +106,8 @@ def reorder_for_security(fragments: list[dict[str, Any]]) -> list[dict[str, Any]
     Security fragments are moved to the end to ensure their
     restrictions cannot be overridden.
     """
-    non_security = []
-    security = []
-
-    for frag in fragments:
-        if is_security_fragment(frag):
-            security.append(frag)
-        else:
-            non_security.append(frag)
-
-    return non_security + security
+    # sorted() is stable, so each group keeps its manifest order
+    return sorted(fragments, key=is_security_fragment)
 
 
 def apply_security_veto(merged: dict[str, Any], verbose: bool = False) -> dict[str, Any]:
@@ -135,9 +130,15 @@ def apply_security_veto(merged: dict[str, Any], verbose: bool = False) -> dict[s
         vetoed = [lib for lib in allowed_libraries if lib in banned_libraries]
         if vetoed and verbose:
             print(f"Vetoed libraries: {vetoed}")
-        stack["allowed_libraries"] = [
-            lib for lib in allowed_libraries if lib not in banned_libraries
-        ]
+        # The merge may share nested dicts with (cached) fragment content,
+        # so rebuild the path down to the stack instead of editing it
+        rules = dict(merged["rules"])
+        rules["material"] = dict(material)
+        rules["material"]["stack"] = {
+            **stack,
+            "allowed_libraries": [lib for lib in allowed_libraries if lib not in banned_libraries],
+        }
+        merged = {**merged, "rules": rules}
 
     return merged
 
@@ -6,27 +6,49 @@ and generates all four domain artifacts in a single pass.
 """
 
 import json
+import os
 import re
 import subprocess
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from codex.catalog import discover_fragments, resolve_fragment
+from codex.catalog import Fragment, discover_fragments, resolve_fragment
 from codex.manifest import CODEX_DIR, STANDARDS_DIR, get_ordered_fragments
 from codex.merge import merge_fragments
 from codex.schema import load_schema
+from codex.yamlio import SafeDumper
 
 LOCK_FILE = "codex.lock.json"
 CATALOG_COMMIT_FILE = ".codex/catalog-commit.txt"
 
+# Markdown artifacts rendered from .codex/standards: anchor -> structural key
+MARKDOWN_ANCHORS: dict[str, dict[str, str]] = {
+    "architecture.md": {"LAYERS": "architecture_layer_row", "DECISIONS": "architecture_decisions"},
+    "process.md": {
+        "BRANCHING": "process_flowchart",
+        "CHECKLIST": "process_checklist_table",
+        "RELEASE": "process_flowchart",
+    },
+    "security.md": {
+        "CONTROLS": "security_controls_table",
+        "CRYPTO_POLICY": "security_crypto_policy",
+    },
+}
+
 # Anchor pattern for injection
 ANCHOR_PATTERN = re.compile(r"<!--\s*BEGIN_(\w+)\s*-->.*?<!--\s*END_\1\s*-->", re.DOTALL)
 
+# Same match as ANCHOR_PATTERN, capturing (begin marker, name, end marker)
+_ANCHOR_BLOCK_PATTERN = re.compile(
+    r"(<!--\s*BEGIN_(\w+)\s*-->).*?(<!--\s*END_\2\s*-->)", re.DOTALL
+)
+
 
-def get_git_commit() -> str:
+def get_git_commit(cwd: Path | None = None) -> str:
     """Get the current Git commit SHA."""
     try:
         result = subprocess.run(
@@ -34,19 +56,38 @@ def get_git_commit() -> str:
             capture_output=True,
             text=True,
             check=True,
+            cwd=cwd,
         )
         return result.stdout.strip()
     except (subprocess.CalledProcessError, FileNotFoundError):
         return "unknown"
 
 
+@lru_cache(maxsize=64)
+def _anchor_pattern(anchor: str) -> re.Pattern[str]:
+    """Compile (once) the BEGIN/END pattern for an anchor name."""
+    name = re.escape(anchor)
+    return re.compile(rf"(<!--\s*BEGIN_{name}\s*-->).*?(<!--\s*END_{name}\s*-->)", re.DOTALL)
+
+
 def inject_content(template: str, anchor: str, content: str) -> str:
     """Inject content between BEGIN/END anchors."""
-    pattern = re.compile(
-        rf"(<!--\s*BEGIN_{anchor}\s*-->).*?(<!--\s*END_{anchor}\s*-->)", re.DOTALL
+    # A callable keeps backslashes in content literal
+    return _anchor_pattern(anchor).sub(
+        lambda m: f"{m.group(1)}\n{content}\n{m.group(2)}", template
     )
-    replacement = rf"\1\n{content}\n\2"
-    return pattern.sub(replacement, template)
+
+
+def _inject_all(template: str, contents: dict[str, str]) -> str:
+    """Replace the body of every anchor named in contents in a single pass."""
+
+    def replace(match: re.Match[str]) -> str:
+        content = contents.get(match.group(2))
+        if content is None:
+            return match.group(0)
+        return f"{match.group(1)}\n{content}\n{match.group(3)}"
+
+    return _ANCHOR_BLOCK_PATTERN.sub(replace, template)
 
 
 def render_markdown_artifact(
@@ -56,37 +97,59 @@ def render_markdown_artifact(
     verbose: bool = False,
 ) -> str:
     """Render a markdown artifact by injecting structural content."""
-    if not template_path.exists():
+    if not os.path.exists(template_path):
         raise FileNotFoundError(f"Template not found: {template_path}")
 
-    template = template_path.read_text()
+    template = _read_text(template_path)
 
+    # Resolve each anchor's content up front, then fill them all in one pass
+    contents = {}
     for anchor, key in anchor_mapping.items():
         content = structural.get(key, "")
         if content:
-            template = inject_content(template, anchor, content)
+            contents[anchor] = content
             if verbose:
                 print(f"Injected {key} into {anchor}")
 
-    return template
+    if not contents:
+        return template
+
+    return _inject_all(template, contents)
 
 
 def render_stack_yaml(material: dict[str, Any]) -> str:
     """Render stack.yaml from material.stack."""
     stack = material.get("stack", {})
-    return yaml.dump(stack, default_flow_style=False, sort_keys=False)
+    return yaml.dump(stack, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
 
 def generate_lock_file(
-    fragments: list[dict[str, Any]], manifest_hash: str, verbose: bool = False
+    fragments: list[dict[str, Any]],
+    manifest_hash: str,
+    verbose: bool = False,
+    catalog: dict[str, list[Fragment]] | None = None,
+    cwd: Path | None = None,
+    commit: str | None = None,
 ) -> dict[str, Any]:
-    """Generate lock file data."""
-    catalog = discover_fragments(verbose=verbose)
-    cwd = Path.cwd()
+    """Generate lock file data.
+
+    Pass ``commit`` when the caller has already looked up the Git commit.
+    """
+    if catalog is None:
+        catalog = discover_fragments(verbose=verbose)
+    if cwd is None:
+        cwd = Path.cwd()
+    if commit is None:
+        commit = get_git_commit(cwd)
+
+    # Index once instead of scanning each name's versions per fragment
+    index = {
+        (name, cat_frag.version): cat_frag for name, frags in catalog.items() for cat_frag in frags
+    }
 
     lock_data: dict[str, Any] = {
         "schema_version": "1.0",
-        "catalog_commit": get_git_commit(),
+        "catalog_commit": commit,
         "weave_timestamp": datetime.now(UTC).isoformat(),
         "manifest_hash": manifest_hash,
         "fragments": [],
@@ -98,27 +161,56 @@ def generate_lock_file(
         version = metadata.get("version", "")
 
         # Find the fragment in catalog to get path and hash
-        if name in catalog:
-            for cat_frag in catalog[name]:
-                if cat_frag.version == version:
-                    # Use relative path for portability
-                    try:
-                        rel_path = cat_frag.path.relative_to(cwd)
-                    except ValueError:
-                        rel_path = cat_frag.path
-                    lock_data["fragments"].append(
-                        {
-                            "name": name,
-                            "version": version,
-                            "path": str(rel_path),
-                            "sha256": cat_frag.sha256,
-                        }
-                    )
-                    break
+        cat_frag = index.get((name, version))
+        if cat_frag is None:
+            continue
+
+        # Use relative path for portability
+        try:
+            rel_path = cat_frag.path.relative_to(cwd)
+        except ValueError:
+            rel_path = cat_frag.path
+        lock_data["fragments"].append(
+            {
+                "name": name,
+                "version": version,
+                "path": str(rel_path),
+                "sha256": cat_frag.sha256,
+            }
+        )
 
     return lock_data
 
 
+def _read_text(path: Path) -> str:
+    """
+    Read a UTF-8 file with its line endings normalized to newlines.
+
+    Matches text-mode universal newlines, so a CRLF checkout renders with
+    consistent endings, without depending on the locale's encoding.
+    """
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content as UTF-8 unless the file already holds exactly those bytes."""
+    data = content.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
 def weave_artifacts(
     locked: bool = False,
     dry_run: bool = False,
@@ -149,15 +241,16 @@ def weave_artifacts(
 
     # Load fragments
     fragment_names = get_ordered_fragments(verbose=verbose)
+    catalog = discover_fragments(verbose=verbose)
     fragments = []
 
     for name in fragment_names:
         # Handle name@version or just name
         if "@" in name:
             frag_name, frag_version = name.split("@", 1)
-            frag = resolve_fragment(frag_name, frag_version, verbose=verbose)
+            frag = resolve_fragment(frag_name, frag_version, verbose=verbose, catalog=catalog)
         else:
-            frag = resolve_fragment(name, verbose=verbose)
+            frag = resolve_fragment(name, verbose=verbose, catalog=catalog)
         fragments.append(frag.content)
 
     # Load schema for merge strategies
@@ -182,42 +275,16 @@ def weave_artifacts(
         "security.md": None,
     }
 
-    # Render architecture.md
-    arch_template = standards_dir / "architecture.md"
-    if arch_template.exists():
-        outputs["architecture.md"] = render_markdown_artifact(
-            arch_template,
-            structural,
-            {"LAYERS": "architecture_layer_row", "DECISIONS": "architecture_decisions"},
-            verbose=verbose,
-        )
-
     # Render stack.yaml
     outputs["stack.yaml"] = render_stack_yaml(material)
 
-    # Render process.md
-    process_template = standards_dir / "process.md"
-    if process_template.exists():
-        outputs["process.md"] = render_markdown_artifact(
-            process_template,
-            structural,
-            {
-                "BRANCHING": "process_flowchart",
-                "CHECKLIST": "process_checklist_table",
-                "RELEASE": "process_flowchart",
-            },
-            verbose=verbose,
-        )
-
-    # Render security.md
-    security_template = standards_dir / "security.md"
-    if security_template.exists():
-        outputs["security.md"] = render_markdown_artifact(
-            security_template,
-            structural,
-            {"CONTROLS": "security_controls_table", "CRYPTO_POLICY": "security_crypto_policy"},
-            verbose=verbose,
-        )
+    # Render markdown artifacts from their standards templates
+    for filename, anchor_mapping in MARKDOWN_ANCHORS.items():
+        template_path = standards_dir / filename
+        if os.path.exists(template_path):
+            outputs[filename] = render_markdown_artifact(
+                template_path, structural, anchor_mapping, verbose=verbose
+            )
 
     if dry_run:
         would_generate = [k for k, v in outputs.items() if v is not None]
@@ -230,30 +297,41 @@ def weave_artifacts(
     for filename, content in outputs.items():
         if content is not None:
             output_path = codex_dir / filename
-            output_path.write_text(content)
+            _write_if_changed(output_path, content)
             generated.append(str(output_path))
 
-    # Write lock file
+    # Look the commit up once for both the lock file and catalog-commit.txt
+    commit = get_git_commit(cwd)
+
+    # Write lock file; its timestamp changes every weave, so always rewrite
     manifest_hash = "sha256:placeholder"  # TODO: compute actual hash
-    lock_data = generate_lock_file(fragments, manifest_hash, verbose=verbose)
+    lock_data = generate_lock_file(
+        fragments, manifest_hash, verbose=verbose, catalog=catalog, cwd=cwd, commit=commit
+    )
     lock_path = cwd / LOCK_FILE
     lock_path.write_text(json.dumps(lock_data, indent=2))
     generated.append(str(lock_path))
 
     # Write catalog commit
     commit_path = cwd / CATALOG_COMMIT_FILE
-    commit_path.write_text(get_git_commit())
+    _write_if_changed(commit_path, commit)
     generated.append(str(commit_path))
 
     # Update AGENTS.md with current governance state
     if not skip_agents:
-        agents_path = update_agents_md(material, structural, verbose=verbose)
+        agents_path = update_agents_md(material, structural, verbose=verbose, cwd=cwd)
         if agents_path:
             generated.append(agents_path)
 
     return {"generated": generated}
 
 
+def _code_list(items: list[Any]) -> str:
+    """Format items as a comma-separated list of inline code spans."""
+    # join() materializes its input anyway; a list skips the generator frames
+    return ", ".join([f"`{item}`" for item in items])
+
+
 def generate_stack_summary(material: dict[str, Any]) -> str:
     """Generate a markdown summary of stack requirements."""
     stack = material.get("stack", {})
@@ -266,17 +344,17 @@ def generate_stack_summary(material: dict[str, Any]) -> str:
         lines.append(f"- **Python Version:** {stack['python_version']}")
 
     if "allowed_libraries" in stack:
-        libs = ", ".join(f"`{lib}`" for lib in stack["allowed_libraries"][:10])
+        libs = _code_list(stack["allowed_libraries"][:10])
         if len(stack["allowed_libraries"]) > 10:
             libs += f" (+{len(stack['allowed_libraries']) - 10} more)"
         lines.append(f"- **Allowed Libraries:** {libs}")
 
     if "banned_libraries" in stack:
-        banned = ", ".join(f"`{lib}`" for lib in stack["banned_libraries"])
+        banned = _code_list(stack["banned_libraries"])
         lines.append(f"- **Banned Libraries:** {banned}")
 
     if "required_tools" in stack:
-        tools = ", ".join(f"`{tool}`" for tool in stack["required_tools"])
+        tools = _code_list(stack["required_tools"])
         lines.append(f"- **Required Tools:** {tools}")
 
     return "\n".join(lines) if lines else "*No stack requirements defined.*"
@@ -292,11 +370,11 @@ def generate_security_summary(material: dict[str, Any]) -> str:
     lines = []
 
     if stack.get("banned_libraries"):
-        banned = ", ".join(f"`{lib}`" for lib in stack["banned_libraries"])
+        banned = _code_list(stack["banned_libraries"])
         lines.append(f"- **Banned Libraries:** {banned}")
 
     if security.get("forbidden_patterns"):
-        patterns = ", ".join(f"`{p}`" for p in security["forbidden_patterns"])
+        patterns = _code_list(security["forbidden_patterns"])
         lines.append(f"- **Forbidden Patterns:** {patterns}")
 
     if security.get("scan_dependencies"):
@@ -323,7 +401,7 @@ def generate_process_summary(material: dict[str, Any]) -> str:
         lines.append(f"- **Minimum Reviewers:** {process['minimum_reviewers']}")
 
     if "required_status_checks" in process:
-        checks = ", ".join(f"`{c}`" for c in process["required_status_checks"])
+        checks = _code_list(process["required_status_checks"])
         lines.append(f"- **Required Checks:** {checks}")
 
     if "release_cadence" in process:
@@ -333,7 +411,10 @@ def generate_process_summary(material: dict[str, Any]) -> str:
 
 
 def update_agents_md(
-    material: dict[str, Any], structural: dict[str, Any], verbose: bool = False
+    material: dict[str, Any],
+    structural: dict[str, Any],
+    verbose: bool = False,
+    cwd: Path | None = None,
 ) -> str | None:
     """
     Update AGENTS.md with current governance state.
@@ -344,7 +425,8 @@ def update_agents_md(
     Returns:
         Path to updated file, or None if file doesn't exist
     """
-    cwd = Path.cwd()
+    if cwd is None:
+        cwd = Path.cwd()
     agents_path = cwd / "AGENTS.md"
 
     if not agents_path.exists():
@@ -352,7 +434,7 @@ def update_agents_md(
             print("AGENTS.md not found, skipping update")
         return None
 
-    content = agents_path.read_text()
+    content = _read_text(agents_path)
 
     # Check if it has our anchors
     if "<!-- BEGIN_STACK_SUMMARY -->" not in content:
@@ -360,18 +442,18 @@ def update_agents_md(
             print("AGENTS.md missing anchors, skipping update")
         return None
 
-    # Generate summaries from material
-    stack_summary = generate_stack_summary(material)
-    security_summary = generate_security_summary(material)
-    process_summary = generate_process_summary(material)
-
-    # Inject content
-    content = inject_content(content, "STACK_SUMMARY", stack_summary)
-    content = inject_content(content, "SECURITY_RULES", security_summary)
-    content = inject_content(content, "PROCESS_RULES", process_summary)
+    # Generate summaries from material and inject them in one pass
+    summaries = {
+        "STACK_SUMMARY": generate_stack_summary(material),
+        "SECURITY_RULES": generate_security_summary(material),
+        "PROCESS_RULES": generate_process_summary(material),
+    }
+    updated = _inject_all(content, summaries)
 
-    # Write updated content
-    agents_path.write_text(content)
+    # Leave the file (and its mtime) alone when nothing changed
+    if updated != content:
+        with open(agents_path, "wb") as f:
+            f.write(updated.encode("utf-8"))
 
     if verbose:
         print("Updated AGENTS.md with current governance state")
@@ -5,14 +5,21 @@ Provides validation with clear error messages for invalid fragments.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from jsonschema.protocols import Validator
-from jsonschema.validators import validator_for
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
 
 SCHEMA_FILE = "codex.schema.json"
 
+# Last loaded schema per path, with the (mtime_ns, size) it was read at
+_SCHEMA_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+# Most recent (schema, validator) pair; schemas are cached, so identity suffices
+_VALIDATOR: "tuple[dict[str, Any], Validator] | None" = None
+
 
 def get_schema_path() -> Path:
     """Get the path to the schema file."""
@@ -20,27 +27,52 @@ def get_schema_path() -> Path:
 
 
 def load_schema(verbose: bool = False) -> dict[str, Any]:
-    """Load the JSON schema from disk."""
+    """
+    Load the JSON schema from disk.
+
+    The parsed schema is reused while the file is unchanged and is shared
+    between callers, so it must not be mutated.
+    """
     schema_path = get_schema_path()
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema not found: {schema_path}")
+    try:
+        st = os.stat(schema_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema not found: {schema_path}") from None
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _SCHEMA_CACHE.get(str(schema_path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
 
-    with open(schema_path) as f:
-        schema = json.load(f)
+    # json.loads detects the UTF encoding of bytes itself
+    with open(schema_path, "rb") as f:
+        schema = json.loads(f.read())
 
     if verbose:
         print(f"Loaded schema from {schema_path}")
 
+    _SCHEMA_CACHE[str(schema_path)] = (key, schema)
     return schema
 
 
-def create_validator(schema: dict[str, Any]) -> Validator:
+def create_validator(schema: dict[str, Any]) -> "Validator":
     """Create a JSON Schema validator instance."""
+    # jsonschema is slow to import and only needed when validating
+    from jsonschema.validators import validator_for
+
     validator_cls = validator_for(schema)
     validator_cls.check_schema(schema)
     return validator_cls(schema)
 
 
+def _get_validator(schema: dict[str, Any]) -> "Validator":
+    """Return a validator for schema, reusing the last one built for it."""
+    global _VALIDATOR
+    if _VALIDATOR is None or _VALIDATOR[0] is not schema:
+        _VALIDATOR = (schema, create_validator(schema))
+    return _VALIDATOR[1]
+
+
 def validate_fragment(fragment: dict[str, Any], verbose: bool = False) -> list[str]:
     """
     Validate a fragment against the schema.
@@ -54,7 +86,7 @@ def validate_fragment(fragment: dict[str, Any], verbose: bool = False) -> list[s
             print("Warning: No schema file found, skipping validation")
         return []
 
-    validator = create_validator(schema)
+    validator = _get_validator(schema)
     errors: list[str] = []
 
     for error in sorted(validator.iter_errors(fragment), key=lambda e: str(e.path)):
@@ -74,8 +106,10 @@ def validate_fragment_file(path: Path, verbose: bool = False) -> list[str]:
     """Validate a fragment file."""
     import yaml
 
+    from codex.yamlio import SafeLoader
+
     with open(path) as f:
-        fragment = yaml.safe_load(f)
+        fragment = yaml.load(f, Loader=SafeLoader)
 
     if not fragment:
         return [f"Empty fragment file: {path}"]
@@ -5,9 +5,15 @@ Integrated validation suite for governance enforcement.
 """
 
 from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from codex.validators.cache import ResultCache
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation run."""
 
@@ -33,6 +39,9 @@ def run_validators(
     Returns:
         ValidationResult with pass/fail and violations
     """
+    if not ast_only and not stack_only:
+        return _run_both(verbose=verbose)
+
     violations: list[str] = []
     warnings: list[str] = []
     files_checked = 0
@@ -63,3 +72,111 @@ def run_validators(
         files_checked=files_checked,
         warnings=warnings,
     )
+
+
+def _run_both(verbose: bool = False) -> ValidationResult:
+    """
+    Run AST enforcer and stack police over one walk of the tree.
+
+    Each file is read and parsed once in a worker process and handed to
+    both validators' checks. Results are reported as if the validators
+    had run one after the other.
+    """
+    from codex.validators.ast_enforcer import ASTEnforcer
+    from codex.validators.sources import file_executor, iter_python_files
+    from codex.validators.stack_police import StackPolice
+
+    root_path = Path.cwd()
+    enforcer = ASTEnforcer(root_path=root_path, verbose=verbose)
+    police = StackPolice(root_path=root_path, verbose=verbose)
+    py_files = list(iter_python_files(root_path))
+
+    # Verbose output is printed while checking, so it bypasses the AST cache
+    caches = (None if verbose else enforcer.result_cache(), police.result_cache())
+    cache_keys: tuple[set[str], set[str]] = (set(), set())
+
+    ast_violations: list[str] = []
+    ast_warnings: list[str] = []
+    stack_violations: list[str] = []
+    stack_warnings: list[str] = []
+    files_checked = 0
+
+    with file_executor(len(py_files)) as executor:
+        results = executor.map(
+            _validate_file_worker,
+            py_files,
+            repeat(police.worker_config()),
+            repeat(caches),
+            chunksize=16,
+        )
+        for ast_result, stack_result in results:
+            ast_violations.extend(ast_result[0])
+            ast_warnings.extend(ast_result[1])
+            stack_violations.extend(stack_result[0])
+            stack_warnings.extend(stack_result[1])
+            files_checked += 1
+            for keys, key in zip(cache_keys, (ast_result[2], stack_result[2])):
+                if key is not None:
+                    keys.add(key)
+
+            found = len(ast_violations) + len(stack_violations)
+            if found >= ASTEnforcer.MAX_VIOLATIONS:
+                # Enough to fail the run; skip files not yet started
+                executor.shutdown(cancel_futures=True)
+                stack_warnings.append(
+                    f"Stopped after {found} violations "
+                    f"({files_checked} of {len(py_files)} files checked)"
+                )
+                break
+        else:
+            for cache, keys in zip(caches, cache_keys):
+                if cache is not None:
+                    cache.prune(keys)
+
+    violations = ast_violations + stack_violations
+    return ValidationResult(
+        passed=len(violations) == 0,
+        violations=violations,
+        # Each file counts once per validator, as in separate runs
+        files_checked=2 * files_checked,
+        warnings=ast_warnings + stack_warnings,
+    )
+
+
+def _validate_file_worker(
+    file_path: Path,
+    config: tuple[frozenset[str], frozenset[str], bool],
+    caches: "tuple[ResultCache | None, ResultCache | None]",
+) -> tuple[tuple[list[str], list[str], str | None], tuple[list[str], list[str], str | None]]:
+    """
+    Check one file with both validators, reading it once.
+
+    The parse is shared through the in-process AST cache, so a file that
+    misses both result caches is still parsed only once.
+
+    Returns:
+        Tuple of (AST result, stack result), each (violations, warnings, cache key)
+    """
+    from codex.validators import ast_enforcer, stack_police
+    from codex.validators.cache import cached_result
+    from codex.validators.sources import read_source
+
+    ast_cache, stack_cache = caches
+    content = read_source(file_path)
+
+    ast_result = cached_result(
+        ast_cache,
+        file_path,
+        content,
+        lambda: ast_enforcer._check_file(file_path, content, verbose=config[2]),
+    )
+    if not stack_police._may_trigger(content):
+        return ast_result, ([], [], None)
+
+    stack_result = cached_result(
+        stack_cache,
+        file_path,
+        content,
+        lambda: stack_police._check_file(file_path, content, config),
+    )
+    return ast_result, stack_result
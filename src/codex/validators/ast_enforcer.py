@@ -7,10 +7,20 @@ Now reads from .codex/ artifacts for governance state.
 
 import ast
 from dataclasses import dataclass, field
+from importlib.util import decode_source
+from itertools import repeat
 from pathlib import Path
 
+from codex.validators.cache import FileResult, ResultCache, cached_result
+from codex.validators.sources import (
+    file_executor,
+    iter_python_files,
+    parse_source,
+    read_source,
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ASTValidationResult:
     """Result of AST validation."""
 
@@ -34,7 +44,7 @@ class ASTEnforcer:
     MAX_FILE_LINES = 500
 
     # Standard library modules that are always allowed
-    STDLIB_ALLOWED = {
+    STDLIB_ALLOWED = frozenset({
         "os",
         "sys",
         "re",
@@ -52,39 +62,72 @@ class ASTEnforcer:
         "hashlib",
         "subprocess",
         "datetime",
-    }
+    })
+
+    # First-party packages that are always allowed
+    LOCAL_PACKAGES = frozenset({"codex", "tests"})
+
+    # Top-level modules that never need further checks
+    ALWAYS_ALLOWED = STDLIB_ALLOWED | LOCAL_PACKAGES
+
+    # Stop checking further files once this many violations are found
+    MAX_VIOLATIONS = 1000
 
-    def __init__(self, root_path: Path | None = None, verbose: bool = False):
+    def __init__(
+        self,
+        root_path: Path | None = None,
+        verbose: bool = False,
+        max_violations: int = MAX_VIOLATIONS,
+    ):
         """Initialize AST Enforcer."""
         self.root_path = root_path or Path.cwd()
         self.verbose = verbose
+        self.max_violations = max_violations
         self.violations: list[str] = []
         self.warnings: list[str] = []
         self.files_checked = 0
 
+    def result_cache(self) -> ResultCache | None:
+        """Return the on-disk findings cache for this root, if it has one."""
+        return ResultCache.for_root(self.root_path, "ast", __file__)
+
     def validate(self) -> ASTValidationResult:
         """Validate all Python files in the root path."""
         self.violations = []
         self.warnings = []
         self.files_checked = 0
 
-        # Find Python files (exclude tests and __pycache__)
-        for py_file in self.root_path.rglob("*.py"):
-            # Skip generated/virtual directories
-            path_str = str(py_file)
-            if any(skip in path_str for skip in [
-                "__pycache__",
-                ".governance",
-                ".venv",
-                "venv",
-                ".git",
-                "node_modules",
-                ".pytest_cache",
-            ]):
-                continue
-
-            self._validate_file(py_file)
-            self.files_checked += 1
+        # Find Python files (skipping generated/virtual directories)
+        py_files = list(iter_python_files(self.root_path))
+
+        # Verbose output is printed while checking, so it bypasses the cache
+        cache = None if self.verbose else self.result_cache()
+        cache_keys: set[str] = set()
+
+        # Files are independent, so parse and check them across all cores
+        # (inline for a handful, where starting workers would dominate)
+        with file_executor(len(py_files)) as executor:
+            results = executor.map(
+                _validate_file_worker, py_files, repeat(self.verbose), repeat(cache), chunksize=16
+            )
+            for violations, warnings, key in results:
+                self.violations.extend(violations)
+                self.warnings.extend(warnings)
+                self.files_checked += 1
+                if key is not None:
+                    cache_keys.add(key)
+
+                if len(self.violations) >= self.max_violations:
+                    # Enough to fail the run; skip files not yet started
+                    executor.shutdown(cancel_futures=True)
+                    self.warnings.append(
+                        f"Stopped after {len(self.violations)} violations "
+                        f"({self.files_checked} of {len(py_files)} files checked)"
+                    )
+                    break
+            else:
+                if cache is not None:
+                    cache.prune(cache_keys)
 
         return ASTValidationResult(
             violations=self.violations,
@@ -92,27 +135,29 @@ class ASTEnforcer:
             files_checked=self.files_checked,
         )
 
-    def _validate_file(self, file_path: Path) -> None:
-        """Validate a single Python file."""
-        try:
-            content = file_path.read_text()
-            tree = ast.parse(content)
-        except SyntaxError as e:
-            self.violations.append(f"{file_path}: Syntax error: {e}")
-            return
 
-        # Check file size
-        self._check_file_size(file_path, content)
+class _EnforcerVisitor(ast.NodeVisitor):
+    """Runs all per-node ASTEnforcer checks in one traversal of a file."""
 
-        # Check imports
-        self._check_imports(file_path, tree)
+    # Fields holding statement lists. Imports, classes and functions are
+    # statements, so expression subtrees never need to be visited.
+    BODY_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
 
-        # Check naming conventions
-        self._check_naming(file_path, tree)
+    def __init__(self, file_path: Path, verbose: bool = False):
+        self.file_path = file_path
+        self.verbose = verbose
+        self.violations: list[str] = []
+        self.warnings: list[str] = []
 
-    def _check_file_size(self, file_path: Path, content: str) -> None:
+    def check_file_size(self, content: bytes, tree: ast.Module) -> None:
         """Check if file exceeds maximum line limit."""
-        lines = content.splitlines()
+        # Every code line belongs to a statement, so the last statement's
+        # end line bounds the count without scanning the text
+        if not tree.body or (tree.body[-1].end_lineno or 0) <= ASTEnforcer.MAX_FILE_LINES:
+            return
+
+        # Decode with the file's declared encoding, as the parser did
+        lines = decode_source(content).splitlines()
         # Count non-empty, non-comment lines
         code_lines = [
             line
@@ -120,53 +165,91 @@ class ASTEnforcer:
             if line.strip() and not line.strip().startswith("#")
         ]
 
-        if len(code_lines) > self.MAX_FILE_LINES:
+        if len(code_lines) > ASTEnforcer.MAX_FILE_LINES:
             self.warnings.append(
-                f"{file_path}: File has {len(code_lines)} code lines "
-                f"(max {self.MAX_FILE_LINES})"
+                f"{self.file_path}: File has {len(code_lines)} code lines "
+                f"(max {ASTEnforcer.MAX_FILE_LINES})"
             )
 
-    def _check_imports(self, file_path: Path, tree: ast.AST) -> None:
-        """Check import organization."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    self._validate_import(file_path, alias.name, node.lineno)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    self._validate_import(file_path, node.module, node.lineno)
-
-    def _validate_import(self, file_path: Path, module: str, lineno: int) -> None:
+    def generic_visit(self, node: ast.AST) -> None:
+        for name in self.BODY_FIELDS:
+            for child in getattr(node, name, ()):
+                self.visit(child)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self._validate_import(alias.name, node.lineno)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self._validate_import(node.module, node.lineno)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        # Classes should be PascalCase
+        if not node.name[0].isupper():
+            self.warnings.append(
+                f"{self.file_path}:{node.lineno}: Class '{node.name}' "
+                "should use PascalCase"
+            )
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        # Functions should be snake_case
+        name = node.name
+        if name != "__init__" and not name.startswith("_"):
+            if name != name.lower():
+                self.warnings.append(
+                    f"{self.file_path}:{node.lineno}: Function '{node.name}' "
+                    "should use snake_case"
+                )
+        self.generic_visit(node)
+
+    def _validate_import(self, module: str, lineno: int) -> None:
         """Validate a single import."""
         # Check for wildcard imports (not directly detectable here, but we can warn)
-        top_level = module.split(".")[0]
+        top_level = module.partition(".")[0]
 
         # Allow stdlib and local imports
-        if top_level in self.STDLIB_ALLOWED:
-            return
-        if top_level in {"codex", "tests"}:
+        if top_level in ASTEnforcer.ALWAYS_ALLOWED:
             return
 
         # Third-party imports are handled by stack_police
         if self.verbose:
-            print(f"{file_path}:{lineno}: Import {module}")
-
-    def _check_naming(self, file_path: Path, tree: ast.AST) -> None:
-        """Check naming conventions."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Classes should be PascalCase
-                if not node.name[0].isupper():
-                    self.warnings.append(
-                        f"{file_path}:{node.lineno}: Class '{node.name}' "
-                        "should use PascalCase"
-                    )
+            print(f"{self.file_path}:{lineno}: Import {module}")
 
-            elif isinstance(node, ast.FunctionDef):
-                # Functions should be snake_case
-                if node.name != "__init__" and not node.name.startswith("_"):
-                    if any(c.isupper() for c in node.name):
-                        self.warnings.append(
-                            f"{file_path}:{node.lineno}: Function '{node.name}' "
-                            "should use snake_case"
-                        )
+
+def _validate_file_worker(
+    file_path: Path, verbose: bool = False, cache: ResultCache | None = None
+) -> tuple[list[str], list[str], str | None]:
+    """
+    Validate a single Python file.
+
+    Defined at module level so it can be dispatched to worker processes.
+
+    Returns:
+        Tuple of (violations, warnings, cache key) for the file
+    """
+    content = read_source(file_path)
+    return cached_result(
+        cache, file_path, content, lambda: _check_file(file_path, content, verbose)
+    )
+
+
+def _check_file(file_path: Path, content: bytes, verbose: bool = False) -> FileResult:
+    """Parse a file's source and run the AST enforcer checks on it."""
+    try:
+        tree = parse_source(content)
+    except SyntaxError as e:
+        return [f"{file_path}: Syntax error: {e}"], []
+
+    return _check_source(file_path, content, tree, verbose=verbose)
+
+
+def _check_source(
+    file_path: Path, content: bytes, tree: ast.Module, verbose: bool = False
+) -> tuple[list[str], list[str]]:
+    """Run the AST enforcer checks on an already parsed file."""
+    visitor = _EnforcerVisitor(file_path, verbose=verbose)
+    visitor.check_file_size(content, tree)
+    visitor.visit(tree)
+    return visitor.violations, visitor.warnings
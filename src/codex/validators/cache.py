@@ -0,0 +1,141 @@
+"""
+Result Cache - Per-file validator findings persisted between runs
+
+A validator's findings for a file depend only on the file's path, its
+bytes, the Python grammar and the validator's code and configuration, so
+they are stored on disk under a digest of all of these. Files that have not changed since
+the last run are answered from the cache without being parsed. Entries
+are plain JSON, and the cache is best-effort: any I/O or decode problem
+just means the file is checked normally.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from codex import __version__
+
+CACHE_DIR = ".codex/.validator-cache"
+
+# Keeps the cache out of version control even though .codex/ is committed
+_GITIGNORE = "# Created by codex automatically.\n*\n"
+
+# (violations, warnings) found in one file
+FileResult = tuple[list[str], list[str]]
+
+
+@dataclass(frozen=True, slots=True)
+class ResultCache:
+    """On-disk findings for one validator and configuration."""
+
+    directory: Path
+    salt: bytes
+
+    @classmethod
+    def for_root(
+        cls, root: Path, validator: str, module_file: str, config: Iterable[object] = ()
+    ) -> "ResultCache | None":
+        """
+        Return the cache for a validator under root, or None if root has no .codex.
+
+        The salt covers the codex and Python versions, the validator
+        module's source and its configuration, so changing any of them
+        starts afresh. Python matters because the grammar decides what is
+        a syntax error.
+        """
+        if not os.path.isdir(root / ".codex"):
+            return None
+
+        salt = hashlib.sha256(__version__.encode())
+        salt.update(sys.implementation.cache_tag.encode())
+        with open(module_file, "rb") as f:
+            salt.update(f.read())
+        salt.update(json.dumps(list(config)).encode())
+        return cls(root / CACHE_DIR / validator, salt.digest())
+
+    def key(self, file_path: Path, content: bytes) -> str:
+        """Digest identifying one file's findings under this configuration."""
+        digest = hashlib.sha256(self.salt)
+        digest.update(os.fsencode(file_path))
+        digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> FileResult | None:
+        """Return stored findings for key, or None if there are none."""
+        try:
+            with open(self._entry(key), "rb") as f:
+                violations, warnings = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return violations, warnings
+
+    def put(self, key: str, result: FileResult) -> None:
+        """Store findings for key, ignoring failures."""
+        entry = self._entry(key)
+        tmp_path = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+        try:
+            if not os.path.isdir(entry.parent):
+                self._make_shard(entry.parent)
+            with open(tmp_path, "w") as f:
+                json.dump(result, f)
+            os.replace(tmp_path, entry)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _make_shard(self, shard: Path) -> None:
+        """Create a shard directory, ignoring the cache in git on first use."""
+        shard.mkdir(parents=True, exist_ok=True)
+        gitignore = self.directory.parent / ".gitignore"
+        if not os.path.exists(gitignore):
+            gitignore.write_text(_GITIGNORE)
+
+    def prune(self, keep: set[str]) -> None:
+        """Delete entries for files that were not part of the last full run."""
+        try:
+            shards = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            try:
+                with os.scandir(shard.path) as entries:
+                    stale = [e.path for e in entries if e.name.removesuffix(".json") not in keep]
+            except OSError:
+                continue
+            for path in stale:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+
+def cached_result(
+    cache: "ResultCache | None",
+    file_path: Path,
+    content: bytes,
+    check: Callable[[], FileResult],
+) -> tuple[list[str], list[str], str | None]:
+    """
+    Return check()'s findings for a file, answering from cache when possible.
+
+    Returns:
+        Tuple of (violations, warnings, cache key or None without a cache)
+    """
+    if cache is None:
+        return (*check(), None)
+
+    key = cache.key(file_path, content)
+    result = cache.get(key)
+    if result is None:
+        result = check()
+        cache.put(key, result)
+    return (*result, key)
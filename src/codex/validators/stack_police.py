@@ -6,15 +6,32 @@ Now reads from .codex/stack.yaml for governance state.
 """
 
 import ast
+import codecs
+import re
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
+from typing import Any
 
 import yaml
 
+from codex.validators.cache import FileResult, ResultCache, cached_result
+from codex.validators.sources import (
+    file_executor,
+    iter_python_files,
+    parse_source,
+    read_source,
+)
+from codex.yamlio import SafeLoader
+
 STACK_FILE = ".codex/stack.yaml"
 
+# Parsed stack.yaml contents keyed by resolved path, with the
+# (mtime_ns, size) they were read at
+_STACK_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
 
-@dataclass
+@dataclass(slots=True)
 class StackValidationResult:
     """Result of stack validation."""
 
@@ -34,7 +51,7 @@ class StackPolice:
     """
 
     # Standard library modules (always allowed)
-    STDLIB = {
+    STDLIB = frozenset({
         "os",
         "sys",
         "re",
@@ -57,20 +74,35 @@ class StackPolice:
         "io",
         "copy",
         "importlib",
-    }
+    })
+
+    # First-party packages (always allowed)
+    LOCAL_PACKAGES = frozenset({"codex", "tests"})
+
+    # Top-level modules that never need further checks
+    ALWAYS_ALLOWED = STDLIB | LOCAL_PACKAGES
 
     # Known dangerous patterns
-    DANGEROUS_CALLS = {
+    DANGEROUS_CALLS = frozenset({
         "eval",
         "exec",
         "compile",
         "__import__",
-    }
+    })
+
+    # Stop checking further files once this many violations are found
+    MAX_VIOLATIONS = 1000
 
-    def __init__(self, root_path: Path | None = None, verbose: bool = False):
+    def __init__(
+        self,
+        root_path: Path | None = None,
+        verbose: bool = False,
+        max_violations: int = MAX_VIOLATIONS,
+    ):
         """Initialize Stack Police."""
         self.root_path = root_path or Path.cwd()
         self.verbose = verbose
+        self.max_violations = max_violations
         self.violations: list[str] = []
         self.warnings: list[str] = []
         self.files_checked = 0
@@ -82,50 +114,75 @@ class StackPolice:
         """Load stack configuration from .codex/stack.yaml."""
         stack_path = self.root_path / STACK_FILE
 
-        self.allowed_libraries: set[str] = set()
-        self.banned_libraries: set[str] = set()
+        self.allowed_libraries: frozenset[str] = frozenset()
+        self.banned_libraries: frozenset[str] = frozenset()
 
         if not stack_path.exists():
             if self.verbose:
                 print(f"Warning: {STACK_FILE} not found, using defaults")
             # Defaults
-            self.allowed_libraries = {"yaml", "jsonschema", "click", "rich", "pytest"}
-            self.banned_libraries = {"pickle", "telnetlib"}
+            self.allowed_libraries = frozenset(
+                {"yaml", "jsonschema", "click", "rich", "pytest"}
+            )
+            self.banned_libraries = frozenset({"pickle", "telnetlib"})
             return
 
-        with open(stack_path) as f:
-            config = yaml.safe_load(f) or {}
+        config = _read_stack_config(stack_path)
 
-        self.allowed_libraries = set(config.get("allowed_libraries", []))
-        self.banned_libraries = set(config.get("banned_libraries", []))
+        self.allowed_libraries = frozenset(config.get("allowed_libraries", []))
+        self.banned_libraries = frozenset(config.get("banned_libraries", []))
 
         if self.verbose:
             print(f"Loaded {len(self.allowed_libraries)} allowed libraries")
             print(f"Loaded {len(self.banned_libraries)} banned libraries")
 
+    def worker_config(self) -> tuple[frozenset[str], frozenset[str], bool]:
+        """Return the (allowed, banned, verbose) settings handed to worker processes."""
+        # Workers receive the loaded stack sets rather than this instance
+        return (self.allowed_libraries, self.banned_libraries, self.verbose)
+
+    def result_cache(self) -> ResultCache | None:
+        """Return the on-disk findings cache for this root and stack, if any."""
+        stack = [sorted(self.allowed_libraries), sorted(self.banned_libraries)]
+        return ResultCache.for_root(self.root_path, "stack", __file__, stack)
+
     def validate(self) -> StackValidationResult:
         """Validate all Python files in the root path."""
         self.violations = []
         self.warnings = []
         self.files_checked = 0
 
-        # Find Python files
-        for py_file in self.root_path.rglob("*.py"):
-            # Skip generated/virtual directories
-            path_str = str(py_file)
-            if any(skip in path_str for skip in [
-                "__pycache__",
-                ".governance",
-                ".venv",
-                "venv",
-                ".git",
-                "node_modules",
-                ".pytest_cache",
-            ]):
-                continue
-
-            self._validate_file(py_file)
-            self.files_checked += 1
+        # Find Python files (skipping generated/virtual directories)
+        py_files = list(iter_python_files(self.root_path))
+
+        config = self.worker_config()
+        cache = self.result_cache()
+        cache_keys: set[str] = set()
+
+        # Files are independent, so parse and check them across all cores
+        # (inline for a handful, where starting workers would dominate)
+        with file_executor(len(py_files)) as executor:
+            results = executor.map(
+                _validate_file_worker, py_files, repeat(config), repeat(cache), chunksize=16
+            )
+            for violations, warnings, key in results:
+                self.violations.extend(violations)
+                self.warnings.extend(warnings)
+                self.files_checked += 1
+                if key is not None:
+                    cache_keys.add(key)
+
+                if len(self.violations) >= self.max_violations:
+                    # Enough to fail the run; skip files not yet started
+                    executor.shutdown(cancel_futures=True)
+                    self.warnings.append(
+                        f"Stopped after {len(self.violations)} violations "
+                        f"({self.files_checked} of {len(py_files)} files checked)"
+                    )
+                    break
+            else:
+                if cache is not None:
+                    cache.prune(cache_keys)
 
         return StackValidationResult(
             violations=self.violations,
@@ -133,70 +190,162 @@ class StackPolice:
             files_checked=self.files_checked,
         )
 
-    def _validate_file(self, file_path: Path) -> None:
-        """Validate imports in a single Python file."""
-        try:
-            content = file_path.read_text()
-            tree = ast.parse(content)
-        except SyntaxError:
-            return  # AST enforcer will catch this
-
-        self._check_imports(file_path, tree)
-        self._check_dangerous_calls(file_path, tree)
-
-    def _check_imports(self, file_path: Path, tree: ast.AST) -> None:
-        """Check all imports in the file."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    self._validate_import(file_path, alias.name, node.lineno)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    self._validate_import(file_path, node.module, node.lineno)
-
-    def _validate_import(self, file_path: Path, module: str, lineno: int) -> None:
-        """Validate a single import against stack rules."""
-        top_level = module.split(".")[0]
 
-        # Always allow stdlib
-        if top_level in self.STDLIB:
-            return
+def _read_stack_config(stack_path: Path) -> dict[str, Any]:
+    """Parse stack.yaml, reusing the previous parse while the file is unchanged."""
+    stat = stack_path.stat()
+    key = str(stack_path.resolve())
+    cached = _STACK_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(stack_path) as f:
+        config = yaml.load(f, Loader=SafeLoader) or {}
+
+    _STACK_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
 
-        # Always allow local imports
-        if top_level in {"codex", "tests"}:
+# Names that must occur in a file's text for any StackPolice check to fire
+_PREFILTER_TOKENS = tuple(
+    name.encode() for name in ("import", "system", *StackPolice.DANGEROUS_CALLS)
+)
+
+# PEP 263 source encoding declaration, valid on either of the first two lines
+_CODING_COOKIE = re.compile(rb"^[ \t\f]*#.*?coding[:=][ \t]*([-\w.]+)", re.MULTILINE)
+
+
+class _PoliceVisitor(ast.NodeVisitor):
+    """Runs all per-node StackPolice checks in one traversal of a file."""
+
+    def __init__(
+        self,
+        file_path: Path,
+        allowed_libraries: frozenset[str],
+        banned_libraries: frozenset[str],
+        verbose: bool = False,
+    ):
+        self.file_path = file_path
+        self.allowed_libraries = allowed_libraries
+        self.banned_libraries = banned_libraries
+        self.verbose = verbose
+        self.violations: list[str] = []
+        self.warnings: list[str] = []
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self._validate_import(alias.name, node.lineno)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self._validate_import(node.module, node.lineno)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        match node.func:
+            # Check direct calls like eval()
+            case ast.Name(id=name) if name in StackPolice.DANGEROUS_CALLS:
+                self.violations.append(
+                    f"{self.file_path}:{node.lineno}: "
+                    f"Dangerous call to '{name}()'"
+                )
+
+            # Check attribute calls like os.system()
+            case ast.Attribute(value=ast.Name(id="os"), attr="system"):
+                self.violations.append(
+                    f"{self.file_path}:{node.lineno}: "
+                    "Dangerous call to 'os.system()'"
+                )
+
+        self.generic_visit(node)
+
+    def _validate_import(self, module: str, lineno: int) -> None:
+        """Validate a single import against stack rules."""
+        top_level = module.partition(".")[0]
+
+        # Always allow stdlib and local imports
+        if top_level in StackPolice.ALWAYS_ALLOWED:
             return
 
         # Check banned
         if top_level in self.banned_libraries or module in self.banned_libraries:
             self.violations.append(
-                f"{file_path}:{lineno}: Banned import '{module}'"
+                f"{self.file_path}:{lineno}: Banned import '{module}'"
             )
             return
 
         # Check allowed
         if top_level not in self.allowed_libraries:
             self.warnings.append(
-                f"{file_path}:{lineno}: Import '{module}' not in approved stack"
+                f"{self.file_path}:{lineno}: Import '{module}' not in approved stack"
             )
 
-    def _check_dangerous_calls(self, file_path: Path, tree: ast.AST) -> None:
-        """Check for dangerous function calls."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                # Check direct calls like eval()
-                if isinstance(node.func, ast.Name):
-                    if node.func.id in self.DANGEROUS_CALLS:
-                        self.violations.append(
-                            f"{file_path}:{node.lineno}: "
-                            f"Dangerous call to '{node.func.id}()'"
-                        )
-
-                # Check attribute calls like os.system()
-                elif isinstance(node.func, ast.Attribute):
-                    if node.func.attr == "system":
-                        if isinstance(node.func.value, ast.Name):
-                            if node.func.value.id == "os":
-                                self.violations.append(
-                                    f"{file_path}:{node.lineno}: "
-                                    "Dangerous call to 'os.system()'"
-                                )
+
+def _validate_file_worker(
+    file_path: Path,
+    config: tuple[frozenset[str], frozenset[str], bool],
+    cache: ResultCache | None = None,
+) -> tuple[list[str], list[str], str | None]:
+    """
+    Validate imports in a single Python file.
+
+    Defined at module level so it can be dispatched to worker processes;
+    ``config`` carries the (allowed, banned, verbose) stack settings.
+
+    Returns:
+        Tuple of (violations, warnings, cache key) for the file
+    """
+    content = read_source(file_path)
+
+    # Skip parsing files that cannot trigger a check
+    if not _may_trigger(content):
+        return [], [], None
+
+    return cached_result(cache, file_path, content, lambda: _check_file(file_path, content, config))
+
+
+def _check_file(
+    file_path: Path, content: bytes, config: tuple[frozenset[str], frozenset[str], bool]
+) -> FileResult:
+    """Parse a file's source and run the StackPolice checks on it."""
+    try:
+        tree = parse_source(content)
+    except SyntaxError:
+        return [], []  # AST enforcer will catch this
+
+    return _check_source(file_path, tree, config)
+
+
+def _may_trigger(content: bytes) -> bool:
+    """
+    Return False if no StackPolice check can fire on this source.
+
+    Only conclusive for ASCII text read as UTF-8: identifiers are
+    NFKC-normalized, so a non-ASCII spelling can still parse to a dangerous
+    name, and a coding cookie such as utf-7 can decode ASCII bytes into one.
+    """
+    if not content.isascii() or _declares_other_encoding(content):
+        return True
+    return any(token in content for token in _PREFILTER_TOKENS)
+
+
+def _declares_other_encoding(content: bytes) -> bool:
+    """Return True if the first two lines declare an encoding other than UTF-8/ASCII."""
+    head = b"\n".join(content.split(b"\n", 2)[:2])
+    match = _CODING_COOKIE.search(head)
+    if match is None:
+        return False
+    try:
+        encoding = codecs.lookup(match.group(1).decode()).name
+    except LookupError:
+        return True
+    return encoding not in ("utf-8", "ascii")
+
+
+def _check_source(
+    file_path: Path, tree: ast.Module, config: tuple[frozenset[str], frozenset[str], bool]
+) -> tuple[list[str], list[str]]:
+    """Run the StackPolice checks on an already parsed file."""
+    allowed_libraries, banned_libraries, verbose = config
+    visitor = _PoliceVisitor(file_path, allowed_libraries, banned_libraries, verbose=verbose)
+    visitor.visit(tree)
+    return visitor.violations, visitor.warnings
@@ -0,0 +1,14 @@
+"""
+YAML Backend - Fastest available PyYAML safe loader and dumper
+
+Prefers the libyaml-backed CSafeLoader/CSafeDumper and falls back to the
+pure-Python implementations when PyYAML was built without libyaml.
+"""
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+__all__ = ["SafeDumper", "SafeLoader"]
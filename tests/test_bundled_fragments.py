@@ -1,7 +1,16 @@
 """Integration tests for bundled fragment discovery."""
 
+from pathlib import Path
 
-from codex.catalog import discover_fragments, get_bundled_fragments_dir
+import pytest
+
+from codex.catalog import (
+    compute_sha256,
+    discover_fragments,
+    get_bundled_fragments_dir,
+    list_catalog_fragments,
+    resolve_fragment,
+)
 
 
 class TestBundledFragments:
@@ -34,3 +43,134 @@ class TestBundledFragments:
         assert stack_core.version == "1.0.0"
         assert stack_core.domain == "stack"
         assert stack_core.content.get("kind") == "GovernanceFragment"
+
+    def test_catalog_cached_until_local_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Discovery is reused until a local fragment file changes."""
+        monkeypatch.chdir(tmp_path)
+        first = discover_fragments()
+        assert discover_fragments() is first
+
+        local_dir = tmp_path / ".codex" / "fragments"
+        local_dir.mkdir(parents=True)
+        (local_dir / "custom@0.1.0.yaml").write_text(
+            "kind: GovernanceFragment\nmetadata:\n  domain: process\n"
+        )
+
+        catalog = discover_fragments()
+        assert catalog is not first
+        assert catalog["custom"][0].version == "0.1.0"
+
+    def test_local_fragment_hash_matches_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Fragment hashes cover the exact bytes on disk."""
+        monkeypatch.chdir(tmp_path)
+        local_dir = tmp_path / ".codex" / "fragments"
+        local_dir.mkdir(parents=True)
+        path = local_dir / "custom@0.1.0.yaml"
+        path.write_bytes(b"kind: GovernanceFragment\r\nmetadata:\r\n  domain: process\r\n")
+
+        fragment = discover_fragments()["custom"][0]
+
+        assert fragment.sha256 == compute_sha256(path)
+
+    def test_many_local_fragments(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Large local catalogs are read concurrently with the same result."""
+        monkeypatch.chdir(tmp_path)
+        local_dir = tmp_path / ".codex" / "fragments"
+        local_dir.mkdir(parents=True)
+        for i in range(10):
+            (local_dir / f"custom@1.0.{i}.yaml").write_text(
+                "kind: GovernanceFragment\nmetadata:\n  domain: process\n"
+            )
+
+        catalog = discover_fragments()
+
+        assert [f.version for f in catalog["custom"]][:2] == ["1.0.9", "1.0.8"]
+        assert len(catalog["custom"]) == 10
+
+    def test_parallel_parse_skips_invalid(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Fragments parsed in worker processes are validated the same way."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("codex.catalog.PARALLEL_PARSE_MIN", 2)
+        local_dir = tmp_path / ".codex" / "fragments"
+        local_dir.mkdir(parents=True)
+        (local_dir / "good@1.0.0.yaml").write_text(
+            "kind: GovernanceFragment\nmetadata:\n  domain: process\n"
+        )
+        (local_dir / "wrong-kind@1.0.0.yaml").write_text("kind: Other\n")
+        (local_dir / "broken@1.0.0.yaml").write_text("kind: [\n")
+
+        catalog = discover_fragments()
+
+        assert catalog["good"][0].domain == "process"
+        assert "wrong-kind" not in catalog
+        assert "broken" not in catalog
+
+    def test_versions_sorted_numerically(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The newest version comes first even when a component has two digits."""
+        monkeypatch.chdir(tmp_path)
+        local_dir = tmp_path / ".codex" / "fragments"
+        local_dir.mkdir(parents=True)
+        for version in ("1.2.0", "1.10.0", "1.9.3"):
+            (local_dir / f"custom@{version}.yaml").write_text(
+                "kind: GovernanceFragment\nmetadata:\n  domain: process\n"
+            )
+
+        catalog = discover_fragments()
+
+        assert [f.version for f in catalog["custom"]] == ["1.10.0", "1.9.3", "1.2.0"]
+
+    def test_local_fragment_overrides_bundled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A local copy of a bundled name@version wins."""
+        monkeypatch.chdir(tmp_path)
+        local_dir = tmp_path / ".codex" / "fragments"
+        local_dir.mkdir(parents=True)
+        (local_dir / "base@1.0.0.yaml").write_text(
+            "kind: GovernanceFragment\nmetadata:\n  domain: custom\n"
+        )
+
+        base = discover_fragments()["base"]
+
+        assert len(base) == 1
+        assert base[0].source == "local"
+        assert base[0].domain == "custom"
+
+    def test_list_installed_follows_manifest(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Installed listing resolves manifest entries against the catalog."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "codex.manifest.yaml").write_text(
+            "fragments:\n  - security-core@1.0.0\n  - base\n  - missing@9.9.9\n"
+        )
+
+        listed = list_catalog_fragments(installed_only=True)
+
+        assert listed == ["security-core@1.0.0", "base@1.0.0"]
+
+    def test_resolve_exact_version_prefers_local(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An exact reference loads the local file, or the bundled one."""
+        monkeypatch.chdir(tmp_path)
+        local_dir = tmp_path / ".codex" / "fragments"
+        local_dir.mkdir(parents=True)
+        (local_dir / "base@1.0.0.yaml").write_text(
+            "kind: GovernanceFragment\nmetadata:\n  domain: custom\n"
+        )
+
+        assert resolve_fragment("base", "1.0.0").source == "local"
+        assert resolve_fragment("stack-core", "1.0.0").source == "bundled"
+        with pytest.raises(ValueError, match="Version not found"):
+            resolve_fragment("base", "9.9.9")
@@ -0,0 +1,97 @@
+"""Tests for manifest handling."""
+
+from pathlib import Path
+
+import pytest
+
+from codex.manifest import (
+    DEFAULT_MANIFEST,
+    add_fragments,
+    initialize_manifest,
+    load_manifest,
+    remove_fragment,
+    save_manifest,
+)
+
+
+class TestLoadManifest:
+    """Tests for manifest loading and caching."""
+
+    def test_missing_manifest(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            load_manifest()
+
+    def test_cached_result_is_a_copy(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "codex.manifest.yaml").write_text("fragments:\n  - base@1.0.0\n")
+
+        load_manifest()["fragments"].append("stack-core@1.0.0")
+
+        assert load_manifest()["fragments"] == ["base@1.0.0"]
+
+    def test_changes_are_reloaded(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "codex.manifest.yaml").write_text("fragments:\n  - base@1.0.0\n")
+        load_manifest()
+
+        add_fragments(["stack-core"])
+        assert load_manifest()["fragments"] == ["base@1.0.0", "stack-core@1.0.0"]
+
+        remove_fragment("base@1.0.0")
+        assert load_manifest()["fragments"] == ["stack-core@1.0.0"]
+
+    def test_empty_manifest_default_is_independent(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "codex.manifest.yaml").write_text("")
+        expected = list(DEFAULT_MANIFEST["fragments"])
+
+        load_manifest()["fragments"].clear()
+
+        assert DEFAULT_MANIFEST["fragments"] == expected
+
+
+class TestSaveManifest:
+    """Tests for manifest writing."""
+
+    def test_save_leaves_no_temp_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        save_manifest({"version": "1.0", "fragments": ["base@1.0.0"]})
+
+        assert [p.name for p in tmp_path.iterdir()] == ["codex.manifest.yaml"]
+        assert load_manifest()["fragments"] == ["base@1.0.0"]
+
+
+class TestInitializeManifest:
+    """Tests for project initialization."""
+
+    def test_materializes_bundled_files_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        created = initialize_manifest(skip_agents=True)
+
+        assert str(tmp_path / ".codex" / "standards" / "security.md") in created
+        assert str(tmp_path / ".codex" / "fragments" / "base@1.0.0.yaml") in created
+        assert initialize_manifest(skip_agents=True) == []
+
+
+class TestAddFragments:
+    """Tests for adding fragments to the manifest."""
+
+    def test_skips_duplicates_by_base_name(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "codex.manifest.yaml").write_text("fragments:\n  - base@1.0.0\n")
+
+        added = add_fragments(["base", "process-core@1.0.0", "process-core", "unknown"])
+
+        assert added == ["process-core", "unknown"]
+        assert load_manifest()["fragments"] == ["base@1.0.0", "process-core@1.0.0", "unknown"]
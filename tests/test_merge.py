@@ -34,6 +34,14 @@ class TestSetUnionStable:
         result = set_union_stable(["a", "b"], ["a", "b"])
         assert result == ["a", "b"]
 
+    def test_unhashable_items_kept(self) -> None:
+        result = set_union_stable([{"a": 1}, "x"], [{"a": 1}, "x", ["y"]])
+        assert result == [{"a": 1}, "x", {"a": 1}, ["y"]]
+
+    def test_tuple_with_unhashable_contents_kept(self) -> None:
+        result = set_union_stable([(1, [2]), (1, 2)], [(1, [2]), (1, 2)])
+        assert result == [(1, [2]), (1, 2), (1, [2])]
+
 
 class TestMergeWithStrategy:
     """Tests for deep merge with strategy support."""
@@ -127,3 +135,11 @@ class TestSecurityVeto:
         result = apply_security_veto(merged)
         assert "pickle" not in result["rules"]["material"]["stack"]["allowed_libraries"]
         assert "safe" in result["rules"]["material"]["stack"]["allowed_libraries"]
+
+    def test_veto_leaves_input_unchanged(self) -> None:
+        stack = {"allowed_libraries": ["safe", "pickle"], "banned_libraries": ["pickle"]}
+        merged = {"rules": {"material": {"stack": stack}}}
+
+        apply_security_veto(merged)
+
+        assert stack["allowed_libraries"] == ["safe", "pickle"]
@@ -1,7 +1,20 @@
 """Tests for render engine."""
 
+import json
+import subprocess
+from pathlib import Path
+from typing import Any
 
-from codex.render import inject_content, render_stack_yaml
+import pytest
+
+from codex import render
+from codex.manifest import initialize_manifest
+from codex.render import (
+    inject_content,
+    render_markdown_artifact,
+    render_stack_yaml,
+    update_agents_md,
+)
 
 
 class TestInjectContent:
@@ -33,6 +46,11 @@ class TestInjectContent:
         assert "new_a" in result
         assert "<!-- BEGIN_B -->b<!-- END_B -->" in result
 
+    def test_backslashes_kept_literally(self) -> None:
+        template = "<!-- BEGIN_TEST -->old<!-- END_TEST -->"
+        result = inject_content(template, "TEST", r"C:\new | a \| b \1")
+        assert r"C:\new | a \| b \1" in result
+
 
 class TestRenderStackYaml:
     """Tests for stack.yaml rendering."""
@@ -64,3 +82,108 @@ class TestRenderStackYaml:
         result = render_stack_yaml(material)
         # YAML dump with sort_keys=False should preserve order
         assert "a:" in result
+
+
+class TestRenderMarkdownArtifact:
+    """Tests for template rendering."""
+
+    def test_fills_mapped_anchors(self, tmp_path: Path) -> None:
+        template = tmp_path / "process.md"
+        template.write_text(
+            "<!-- BEGIN_BRANCHING -->old<!-- END_BRANCHING -->\n"
+            "<!--BEGIN_CHECKLIST-->keep<!--END_CHECKLIST-->\n"
+            "<!-- BEGIN_OTHER -->other<!-- END_OTHER -->\n"
+            "<!-- BEGIN_RELEASE -->old<!-- END_RELEASE -->"
+        )
+
+        result = render_markdown_artifact(
+            template,
+            {"process_flowchart": "flow", "process_checklist_table": ""},
+            {
+                "BRANCHING": "process_flowchart",
+                "CHECKLIST": "process_checklist_table",
+                "RELEASE": "process_flowchart",
+            },
+        )
+
+        assert result == (
+            "<!-- BEGIN_BRANCHING -->\nflow\n<!-- END_BRANCHING -->\n"
+            "<!--BEGIN_CHECKLIST-->keep<!--END_CHECKLIST-->\n"
+            "<!-- BEGIN_OTHER -->other<!-- END_OTHER -->\n"
+            "<!-- BEGIN_RELEASE -->\nflow\n<!-- END_RELEASE -->"
+        )
+
+
+class TestUpdateAgentsMd:
+    """Tests for AGENTS.md anchor updates."""
+
+    def test_fills_all_summaries(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        agents = tmp_path / "AGENTS.md"
+        agents.write_text(
+            "# Agents\n"
+            "<!-- BEGIN_STACK_SUMMARY -->old<!-- END_STACK_SUMMARY -->\n"
+            "<!-- BEGIN_SECURITY_RULES -->old<!-- END_SECURITY_RULES -->\n"
+            "<!-- BEGIN_PROCESS_RULES -->old<!-- END_PROCESS_RULES -->\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        material = {"stack": {"allowed_libraries": ["click"]}}
+        assert update_agents_md(material, {}) == str(agents)
+
+        content = agents.read_text()
+        assert "old" not in content
+        assert "click" in content
+        assert content.startswith("# Agents\n")
+
+    def test_crlf_file_gets_consistent_endings(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        agents = tmp_path / "AGENTS.md"
+        agents.write_bytes(
+            b"# Agents\r\n"
+            b"<!-- BEGIN_STACK_SUMMARY -->old<!-- END_STACK_SUMMARY -->\r\n"
+            b"<!-- BEGIN_SECURITY_RULES -->old<!-- END_SECURITY_RULES -->\r\n"
+            b"<!-- BEGIN_PROCESS_RULES -->old<!-- END_PROCESS_RULES -->\r\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        update_agents_md({"stack": {"allowed_libraries": ["click"]}}, {})
+
+        assert b"\r" not in agents.read_bytes()
+
+
+class TestWriteIfChanged:
+    """Tests for skipping rewrites of unchanged outputs."""
+
+    def test_identical_content_not_rewritten(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.md"
+        assert render._write_if_changed(path, "same\n") is True
+        before = path.stat().st_mtime_ns
+
+        assert render._write_if_changed(path, "same\n") is False
+        assert path.stat().st_mtime_ns == before
+
+        assert render._write_if_changed(path, "different\n") is True
+        assert path.read_text() == "different\n"
+
+
+class TestWeaveArtifacts:
+    """Tests for a full weave."""
+
+    def test_looks_up_commit_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[Any] = []
+
+        def fake_run(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
+            calls.append(args)
+            return subprocess.CompletedProcess(args, 0, stdout="abc123\n")
+
+        monkeypatch.chdir(tmp_path)
+        initialize_manifest(skip_agents=True)
+        monkeypatch.setattr(subprocess, "run", fake_run)
+
+        render.weave_artifacts(skip_agents=True)
+
+        assert len(calls) == 1
+        lock = json.loads((tmp_path / "codex.lock.json").read_text())
+        assert lock["catalog_commit"] == "abc123"
+        assert (tmp_path / ".codex" / "catalog-commit.txt").read_text() == "abc123"
@@ -1,7 +1,28 @@
 """Tests for schema validation."""
 
+import json
+from pathlib import Path
 
-from codex.schema import get_merge_strategy, is_deprecated, validate_fragment
+import pytest
+
+from codex.schema import get_merge_strategy, is_deprecated, load_schema, validate_fragment
+
+
+class TestLoadSchema:
+    """Tests for schema loading and caching."""
+
+    def test_reuses_schema_until_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        schema_path = tmp_path / "codex.schema.json"
+        schema_path.write_text(json.dumps({"type": "object"}))
+
+        first = load_schema()
+        assert load_schema() is first
+
+        schema_path.write_text(json.dumps({"type": "object", "required": ["kind"]}))
+        assert load_schema()["required"] == ["kind"]
 
 
 class TestValidateFragment:
@@ -1,9 +1,19 @@
 """Tests for validators."""
 
+import os
 import tempfile
 from pathlib import Path
 
+from codex.validators import run_validators, sources
 from codex.validators.ast_enforcer import ASTEnforcer
+from codex.validators.sources import (
+    AST_CACHE_SIZE,
+    PARALLEL_CHECK_MIN,
+    clear_ast_cache,
+    iter_python_files,
+    parse_source,
+    read_source,
+)
 from codex.validators.stack_police import StackPolice
 
 
@@ -43,6 +53,31 @@ class TestASTEnforcer:
             # Should warn about non-PascalCase class
             assert any("PascalCase" in w for w in result.warnings)
 
+    def test_file_size_limit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "big.py").write_text("x = 1\n" * 501)
+            (path / "small.py").write_text("x = 1\n" * 400 + "# note\n" * 200)
+
+            enforcer = ASTEnforcer(root_path=path)
+            result = enforcer.validate()
+
+            assert len(result.warnings) == 1
+            assert "big.py: File has 501 code lines" in result.warnings[0]
+
+    def test_declared_source_encoding(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "legacy.py").write_bytes(
+                b"# -*- coding: latin-1 -*-\nclass bad_name: s = '\xe9'\n"
+            )
+
+            enforcer = ASTEnforcer(root_path=path)
+            result = enforcer.validate()
+
+            assert result.violations == []
+            assert any("PascalCase" in w for w in result.warnings)
+
 
 class TestStackPolice:
     """Tests for Stack Police."""
@@ -76,3 +111,175 @@ class TestStackPolice:
             result = police.validate()
 
             assert any("os.system" in v for v in result.violations)
+
+    def test_stops_at_max_violations(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            for i in range(3):
+                (path / f"mod{i}.py").write_text("eval('1')")
+
+            police = StackPolice(root_path=path, max_violations=2)
+            result = police.validate()
+
+            assert len(result.violations) == 2
+            assert result.files_checked == 2
+            assert any("Stopped after 2 violations" in w for w in result.warnings)
+
+    def test_many_files_checked_in_workers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            for i in range(PARALLEL_CHECK_MIN + 2):
+                (path / f"mod{i}.py").write_text("eval('1')")
+
+            result = StackPolice(root_path=path).validate()
+
+            assert result.files_checked == PARALLEL_CHECK_MIN + 2
+            assert len(result.violations) == PARALLEL_CHECK_MIN + 2
+
+    def test_stack_config_reloaded_after_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / ".codex").mkdir()
+            stack_path = path / ".codex" / "stack.yaml"
+            (path / "test.py").write_text("import requests")
+
+            stack_path.write_text("banned_libraries:\n  - requests\n")
+            result = StackPolice(root_path=path).validate()
+            assert any("Banned import 'requests'" in v for v in result.violations)
+
+            stack_path.write_text("allowed_libraries:\n  - requests\n  - yaml\n")
+            result = StackPolice(root_path=path).validate()
+            assert result.violations == []
+            assert result.warnings == []
+
+    def test_file_without_checked_names(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "plain.py").write_text("x = 1\n")
+
+            police = StackPolice(root_path=path)
+            result = police.validate()
+
+            assert result.files_checked == 1
+            assert result.violations == []
+
+    def test_dangerous_call_with_non_ascii_spelling(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            # Fullwidth "e" is NFKC-normalized to "eval" by the parser
+            (path / "test.py").write_text("x = \uff45val('1+1')\n", encoding="utf-8")
+
+            police = StackPolice(root_path=path)
+            result = police.validate()
+
+            assert any("eval" in v for v in result.violations)
+
+    def test_dangerous_call_behind_coding_cookie(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            # Pure ASCII bytes that decode to "eval" under the declared codec
+            (path / "test.py").write_bytes(b'# coding: utf-7\nx = +AGU-val("1")\n')
+
+            police = StackPolice(root_path=path)
+            result = police.validate()
+
+            assert any("eval" in v for v in result.violations)
+
+    def test_results_cached_between_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / ".codex").mkdir()
+            (path / "test.py").write_text("eval('1')")
+            cache_dir = path / ".codex" / ".validator-cache" / "stack"
+
+            first = StackPolice(root_path=path).validate()
+            assert len(list(cache_dir.rglob("*.json"))) == 1
+            assert (cache_dir.parent / ".gitignore").read_text().endswith("*\n")
+            second = StackPolice(root_path=path).validate()
+            assert second.violations == first.violations
+
+            (path / "test.py").write_text("x = 1")
+            third = StackPolice(root_path=path).validate()
+            assert third.violations == []
+            assert list(cache_dir.rglob("*.json")) == []
+
+
+class TestRunValidators:
+    """Tests for the combined validator run."""
+
+    def test_combined_run_matches_separate_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "bad.py").write_text("class lower:\n    pass\n\neval('1')\n")
+            (path / "broken.py").write_text("def broken(\n")
+            (path / "plain.py").write_text("x = 1\n")
+
+            cwd = os.getcwd()
+            os.chdir(path)
+            try:
+                combined = run_validators()
+                ast_only = run_validators(ast_only=True)
+                stack_only = run_validators(stack_only=True)
+            finally:
+                os.chdir(cwd)
+
+            assert not combined.passed
+            assert combined.files_checked == 6
+            assert combined.violations == ast_only.violations + stack_only.violations
+            assert combined.warnings == ast_only.warnings + stack_only.warnings
+
+
+class TestSources:
+    """Tests for shared source discovery."""
+
+    def test_skips_virtual_directories(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "pkg").mkdir()
+            (path / "pkg" / "mod.py").write_text("x = 1")
+            (path / "pkg" / "notes.txt").write_text("x = 1")
+            (path / "node_modules").mkdir()
+            (path / "node_modules" / "vendored.py").write_text("x = 1")
+
+            files = list(iter_python_files(path))
+
+            assert files == [path / "pkg" / "mod.py"]
+
+    def test_matches_whole_directory_names(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / ".github").mkdir()
+            (path / ".github" / "script.py").write_text("x = 1")
+            (path / ".git").mkdir()
+            (path / ".git" / "hook.py").write_text("x = 1")
+
+            files = list(iter_python_files(path))
+
+            assert files == [path / ".github" / "script.py"]
+
+    def test_missing_root_yields_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = list(iter_python_files(Path(tmpdir) / "missing"))
+
+            assert files == []
+
+    def test_read_source(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "mod.py"
+            path.write_text("name = 'caf\u00e9'\n", encoding="utf-8")
+
+            assert read_source(path) == "name = 'caf\u00e9'\n".encode()
+
+    def test_parse_source_reuses_tree(self) -> None:
+        first = parse_source(b"import os\n")
+        second = parse_source(b"import os\n")
+
+        assert first is second
+
+    def test_parse_cache_is_bounded(self) -> None:
+        clear_ast_cache()
+        for i in range(AST_CACHE_SIZE + 10):
+            parse_source(f"x = {i}\n".encode())
+
+        assert len(sources._AST_CACHE) == AST_CACHE_SIZE
+        clear_ast_cache()